@@ -0,0 +1,62 @@
+"""
+Compares the psutil and /proc process listing backends.
+
+Spawns a number of idle child processes so the process table is large,
+then times a full heavy-process check with each backend.
+
+    uv run python benchmarks/bench_process_scan.py --spawn 2000
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+from fortscript.games import GAMES
+from fortscript.main import AppsMonitoring
+from fortscript.procscan import proc_scan_supported
+
+
+def bench(monitor: AppsMonitoring, repeat: int) -> float:
+    """Returns the best time (ms) of a full heavy-process check."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        monitor.active_process_list()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--spawn', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    if not proc_scan_supported():
+        sys.exit('The /proc backend is only available on Linux.')
+
+    children = [subprocess.Popen(['sleep', '600']) for _ in range(args.spawn)]
+    try:
+        psutil_monitor = AppsMonitoring(GAMES, backend='psutil')
+        proc_monitor = AppsMonitoring(GAMES, backend='proc')
+        assert (
+            psutil_monitor.active_process_list()
+            == proc_monitor.active_process_list()
+        )
+
+        count = len(proc_monitor.process_names())
+        psutil_ms = bench(psutil_monitor, args.repeat)
+        proc_ms = bench(proc_monitor, args.repeat)
+        print(f'processes: {count}')
+        print(f'psutil:    {psutil_ms:8.2f} ms')
+        print(f'proc:      {proc_ms:8.2f} ms ({psutil_ms / proc_ms:.1f}x)')
+    finally:
+        for child in children:
+            child.kill()
+        for child in children:
+            child.wait()
+
+
+if __name__ == '__main__':
+    main()
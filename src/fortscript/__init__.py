@@ -1,4 +1,45 @@
-from .main import FortScript, RamConfig, Callbacks
-from .games import GAMES
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ['FortScript', 'RamConfig', 'GAMES', 'Callbacks']
+if TYPE_CHECKING:
+    from .detector import AutoDetectConfig as AutoDetectConfig
+    from .games import GAMES as GAMES
+    from .main import AdmissionConfig as AdmissionConfig
+    from .main import Callbacks as Callbacks
+    from .main import FortScript as FortScript
+    from .main import RamConfig as RamConfig
+    from .main import RuleConfig as RuleConfig
+    from .main import SupervisorState as SupervisorState
+    from .main import TimelineConfig as TimelineConfig
+    from .monitors import Monitor as Monitor
+    from .sampler import SystemSampler as SystemSampler
+
+# Public names are imported on first use, so that ``fortscript.checkpoint``
+# (used inside managed projects) doesn't pull in psutil and yaml
+_EXPORTS = {
+    'FortScript': '.main',
+    'RamConfig': '.main',
+    'RuleConfig': '.main',
+    'TimelineConfig': '.main',
+    'Monitor': '.monitors',
+    'GAMES': '.games',
+    'Callbacks': '.main',
+    'AdmissionConfig': '.main',
+    'AutoDetectConfig': '.detector',
+    'SystemSampler': '.sampler',
+    'SupervisorState': '.main',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
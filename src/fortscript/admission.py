@@ -0,0 +1,135 @@
+"""
+Admission control for staggered resumes.
+
+Starting every project at once when RAM drops below ``safe`` often pushes it
+right back over the limit. The admission controller starts projects in
+priority order, learns how much RAM each one adds, and only admits the next
+ones while the projected usage stays under a ceiling. The RAM growth is
+measured on the check after each batch, by the next :meth:`admit` call or,
+once nothing is pending, by :meth:`settle`.
+"""
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """Decides which pending projects can be started."""
+
+    def __init__(
+        self, ceiling: float, smoothing: float = 0.5, unknown_cost: float = 0.0
+    ):
+        """
+        Args:
+            ceiling (float): RAM usage (%) that admitted projects must not
+                be projected to exceed.
+            smoothing (float): Weight of the newest measurement when
+                updating a project's learned RAM cost (0-1].
+            unknown_cost (float): RAM (%) assumed for projects that were
+                never measured. With 0, they are admitted one at a time.
+        """
+        self.ceiling = ceiling
+        self.smoothing = smoothing
+        self.unknown_cost = unknown_cost
+        self.costs: dict[str, float] = {}
+        self.pending: list[dict[str, Any]] = []
+        self._batch: list[str] = []
+        self._ram_before = 0.0
+
+    def begin(self, projects: list[dict[str, Any]]) -> None:
+        """
+        Queues projects for admission, highest ``priority`` first.
+
+        Projects with the same priority keep their configuration order.
+        """
+        self.pending = sorted(projects, key=lambda p: -p.get('priority', 0))
+        self._batch = []
+
+    def cancel(self) -> None:
+        """Drops every pending project (e.g. when scripts are paused)."""
+        self.pending = []
+        self._batch = []
+
+    def admit(self, ram: float) -> list[dict[str, Any]]:
+        """
+        Returns the pending projects that can be started now.
+
+        The RAM growth since the previous call is attributed to the
+        projects admitted then. Projects with an unknown cost are charged
+        ``unknown_cost``, or admitted alone when it is 0 so their cost can
+        be measured. The first project of a call only needs the RAM usage
+        to be under the ceiling.
+
+        Args:
+            ram (float): Current RAM usage (%).
+
+        Returns:
+            list: Projects to start, removed from :attr:`pending`.
+        """
+        self._learn(ram)
+
+        batch: list[dict[str, Any]] = []
+        projected = ram
+        while self.pending:
+            name = self.pending[0].get('name', '')
+            cost = self.costs.get(name)
+            estimate = self.unknown_cost if cost is None else cost
+
+            if cost is None and batch and not self.unknown_cost:
+                break
+            needed = estimate if cost is not None or batch else 0.0
+            if projected + needed >= self.ceiling:
+                logger.debug(
+                    f'Admission of {name} deferred (RAM {projected:.1f}% '
+                    f'+ {needed:.1f}% >= {self.ceiling:.1f}%)'
+                )
+                break
+
+            batch.append(self.pending.pop(0))
+            if cost is None and not self.unknown_cost:
+                break
+            projected += estimate
+
+        self._batch = [p.get('name', '') for p in batch]
+        self._ram_before = ram
+        return batch
+
+    @property
+    def settling(self) -> bool:
+        """True while the last admitted batch hasn't been measured."""
+        return bool(self._batch)
+
+    def settle(self, ram: float) -> None:
+        """
+        Measures the last admitted batch when no project is pending.
+
+        Args:
+            ram (float): Current RAM usage (%).
+        """
+        self._learn(ram)
+
+    def _learn(self, ram: float) -> None:
+        """Updates the learned cost of the previously admitted batch."""
+        if not self._batch:
+            return
+
+        delta = max(0.0, ram - self._ram_before)
+        weights = [
+            self.costs.get(name, self.unknown_cost) for name in self._batch
+        ]
+        total = sum(weights)
+        for name, weight in zip(self._batch, weights):
+            if total:
+                share = delta * weight / total
+            else:
+                share = delta / len(self._batch)
+
+            previous = self.costs.get(name)
+            self.costs[name] = (
+                share
+                if previous is None
+                else previous + self.smoothing * (share - previous)
+            )
+        self._batch = []
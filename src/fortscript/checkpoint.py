@@ -0,0 +1,254 @@
+"""
+Warm-resume checkpoint protocol between FortScript and managed projects.
+
+When checkpoints are enabled, every project is launched with these
+environment variables:
+
+- ``FORTSCRIPT_CHECKPOINT_ADDRESS``: ``host:port`` of FortScript's control
+  socket.
+- ``FORTSCRIPT_CHECKPOINT_TOKEN``: secret to present when connecting.
+- ``FORTSCRIPT_PROJECT``: the project name.
+- ``FORTSCRIPT_RESUMED``: ``1`` if the project acknowledged a checkpoint
+  before it was last paused, ``0`` otherwise.
+
+The protocol is line based: the project connects and sends
+``HELLO <token> <project>``. Before a pause, FortScript sends ``PAUSE``; the
+project saves its state and replies ``ACK`` within the grace period, then
+gets terminated as usual. A real shutdown sends nothing.
+
+Projects written in Python can use :func:`on_checkpoint` and
+:func:`resumed`. This module only uses the standard library and importing it
+doesn't load the rest of FortScript, so it can also be copied into a
+project whose environment doesn't have FortScript installed::
+
+    from fortscript import checkpoint
+
+    if checkpoint.resumed():
+        cache.load('state.pickle')
+    checkpoint.on_checkpoint(lambda: cache.save('state.pickle'))
+"""
+
+import logging
+import os
+import secrets
+import select
+import socket
+import threading
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+ENV_ADDRESS = 'FORTSCRIPT_CHECKPOINT_ADDRESS'
+ENV_TOKEN = 'FORTSCRIPT_CHECKPOINT_TOKEN'
+ENV_PROJECT = 'FORTSCRIPT_PROJECT'
+ENV_RESUMED = 'FORTSCRIPT_RESUMED'
+
+_HELLO_TIMEOUT = 2.0
+
+
+def _read_line(conn: socket.socket, limit: int = 1024) -> bytes:
+    """Reads a single newline-terminated line from a socket."""
+    data = b''
+    while not data.endswith(b'\n') and len(data) < limit:
+        chunk = conn.recv(limit - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data.strip()
+
+
+class CheckpointServer:
+    """Control socket that asks projects to checkpoint before a pause."""
+
+    def __init__(self, host: str = '127.0.0.1'):
+        """
+        Starts listening for projects on an ephemeral local port.
+
+        Args:
+            host (str): Interface to listen on.
+        """
+        self._socket = socket.create_server((host, 0))
+        address, port = self._socket.getsockname()[:2]
+        self.address = f'{address}:{port}'
+        self.token = secrets.token_hex(16)
+
+        self._clients: dict[str, list[socket.socket]] = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._accept_loop,
+            name='fortscript-checkpoint',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def env(self, project: str, resumed: bool) -> dict[str, str]:
+        """Returns the environment variables for a project launch."""
+        return {
+            ENV_ADDRESS: self.address,
+            ENV_TOKEN: self.token,
+            ENV_PROJECT: project,
+            ENV_RESUMED: '1' if resumed else '0',
+        }
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                conn, _ = self._socket.accept()
+            except OSError:
+                return  # Server closed
+
+            # A slow or stray connection must not delay the other projects
+            threading.Thread(
+                target=self._register,
+                args=(conn,),
+                name='fortscript-checkpoint-hello',
+                daemon=True,
+            ).start()
+
+    def _register(self, conn: socket.socket) -> None:
+        """Validates the handshake of a new connection."""
+        try:
+            conn.settimeout(_HELLO_TIMEOUT)
+            command, token, project = _read_line(conn).decode().split(' ', 2)
+            if command != 'HELLO' or not secrets.compare_digest(
+                token, self.token
+            ):
+                raise ValueError('invalid handshake')
+            conn.settimeout(None)
+        except (OSError, ValueError, UnicodeDecodeError):
+            conn.close()
+            return
+
+        with self._lock:
+            self._clients.setdefault(project, []).append(conn)
+        logger.debug(f'Project {project} registered for checkpoints.')
+
+    def checkpoint(self, timeout: float) -> set[str]:
+        """
+        Asks every connected project to checkpoint and waits for them.
+
+        Args:
+            timeout (float): Seconds to wait for the acknowledgements.
+
+        Returns:
+            set[str]: Names of the projects whose connections all
+            acknowledged the checkpoint in time.
+        """
+        with self._lock:
+            clients, self._clients = self._clients, {}
+
+        waiting: dict[socket.socket, str] = {}
+        failed: set[str] = set()
+        for project, conns in clients.items():
+            for conn in conns:
+                try:
+                    conn.sendall(b'PAUSE\n')
+                    waiting[conn] = project
+                except OSError:
+                    conn.close()  # Project already gone
+
+        acked: set[str] = set()
+        deadline = time.monotonic() + timeout
+        while waiting:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            readable, _, _ = select.select(list(waiting), [], [], remaining)
+            for conn in readable:
+                project = waiting.pop(conn)
+                try:
+                    reply = _read_line(conn)
+                except OSError:
+                    reply = b''
+                conn.close()
+                if reply == b'ACK':
+                    acked.add(project)
+                else:
+                    failed.add(project)
+
+        for conn, project in waiting.items():
+            logger.warning(f'Project {project} did not acknowledge in time.')
+            failed.add(project)
+            conn.close()
+
+        return acked - failed
+
+    def close(self) -> None:
+        """Stops listening and drops every connection."""
+        self._socket.close()
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for conns in clients.values():
+            for conn in conns:
+                conn.close()
+
+
+def resumed() -> bool:
+    """Returns True if this project is resuming from a checkpoint."""
+    return os.environ.get(ENV_RESUMED) == '1'
+
+
+class CheckpointClient:
+    """Project side of the protocol."""
+
+    def __init__(self, callback: Callable[[], None]):
+        """
+        Args:
+            callback (Callable): Called when FortScript asks for a
+                checkpoint. The acknowledgement is sent when it returns.
+        """
+        self.callback = callback
+        self._socket: socket.socket | None = None
+
+    def connect(self) -> bool:
+        """
+        Connects to FortScript using the launch environment.
+
+        Returns:
+            bool: False if the project was not started by FortScript with
+            checkpoints enabled.
+        """
+        address = os.environ.get(ENV_ADDRESS)
+        if not address:
+            return False
+
+        host, port = address.rsplit(':', 1)
+        self._socket = socket.create_connection((host, int(port)))
+        hello = (
+            f'HELLO {os.environ.get(ENV_TOKEN, "")} '
+            f'{os.environ.get(ENV_PROJECT, "")}\n'
+        )
+        self._socket.sendall(hello.encode())
+        threading.Thread(
+            target=self._listen, name='fortscript-checkpoint', daemon=True
+        ).start()
+        return True
+
+    def _listen(self) -> None:
+        assert self._socket is not None
+        with self._socket.makefile('rb') as stream:
+            for line in stream:
+                if line.strip() != b'PAUSE':
+                    continue
+                try:
+                    self.callback()
+                except Exception as e:
+                    logger.error(f'Error in checkpoint callback: {e}')
+                    continue  # No ACK, FortScript treats it as a cold stop
+                self._socket.sendall(b'ACK\n')
+
+
+def on_checkpoint(callback: Callable[[], None]) -> CheckpointClient | None:
+    """
+    Registers a function that saves the project state before a pause.
+
+    Args:
+        callback (Callable): Function saving the warm state.
+
+    Returns:
+        CheckpointClient | None: The connected client, or None when the
+        project is not managed by FortScript with checkpoints enabled.
+    """
+    client = CheckpointClient(callback)
+    return client if client.connect() else None
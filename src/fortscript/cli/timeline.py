@@ -0,0 +1,36 @@
+import argparse
+import sys
+
+from fortscript.recorder import export_csv, export_json, read_timeline
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Exports a FortScript timeline file to CSV or JSON."""
+    parser = argparse.ArgumentParser(
+        prog='fort-timeline',
+        description='Export a FortScript timeline file to CSV or JSON.',
+    )
+    parser.add_argument('path', help='timeline file to read')
+    parser.add_argument(
+        '-f', '--format', choices=['csv', 'json'], default='csv'
+    )
+    parser.add_argument(
+        '-o', '--output', help='output file (defaults to stdout)'
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        records = read_timeline(args.path)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f'fort-timeline: {e}\n')
+
+    export = export_csv if args.format == 'csv' else export_json
+    if args.output:
+        with open(args.output, 'w', newline='') as file:
+            export(records, file)
+    else:
+        export(records, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+Resource-based detection of heavy processes.
+
+Name lists only catch the games and apps they know about. The detector
+flags any foreign process whose CPU or resident memory stays above a limit
+for several consecutive checks, like a new game, a rogue Electron app or a
+large compile.
+
+Per-process usage comes from the shared process table (the ``/proc``
+scanner or psutil, read once per check by :class:`SystemSampler` when groups
+share one), so detection adds no scan of its own. The processes over a
+limit are kept across checks and updated in place as the table is read;
+only these candidates, usually a handful, are ranked to pick the ``top_k``
+(``O(n + c log k)`` per check). Each ranked process charges a counter that
+drains when it is not ranked, so a process is flagged after ``sustain`` hot
+checks and released after ``sustain`` cool ones.
+"""
+
+import heapq
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, NamedTuple
+
+from .procscan import ProcessSample
+
+MB = 1024 * 1024
+
+
+class Consumer(NamedTuple):
+    """A process over one of the detector limits."""
+
+    score: float
+    pid: int
+    name: str
+    cpu: float
+    rss_mb: float
+
+
+@dataclass
+class AutoDetectConfig:
+    """
+    Resource-based heavy process detection.
+
+    A process not managed by FortScript that stays above ``cpu_percent``
+    (100 is one full core) or ``rss_mb`` for ``sustain`` checks is treated
+    like a heavy process.
+    """
+
+    enabled: bool = True
+    cpu_percent: float = 80.0
+    rss_mb: float = 4096
+    sustain: int = 3
+    top_k: int = 5
+    ignore: list[str] = field(default_factory=list)
+
+
+class ResourceDetector:
+    """Finds foreign processes with sustained high CPU or memory usage."""
+
+    def __init__(
+        self,
+        config: AutoDetectConfig | None = None,
+        exclude: Callable[[int], bool] | None = None,
+    ):
+        """
+        Args:
+            config (AutoDetectConfig, optional): Limits, number of
+                consecutive checks over a limit before a process is flagged
+                (and under it before it is released), maximum number of
+                processes tracked per check and process names never flagged.
+            exclude (Callable[[int], bool], optional): Returns True for PIDs
+                that must not be flagged, like FortScript's own projects.
+        """
+        config = config or AutoDetectConfig()
+        if config.cpu_percent <= 0 or config.rss_mb <= 0:
+            raise ValueError('Detector limits must be positive')
+        if config.sustain < 1 or config.top_k < 1:
+            raise ValueError('sustain and top_k must be at least 1')
+
+        self.cpu_percent = config.cpu_percent
+        self.rss_mb = config.rss_mb
+        self.sustain = config.sustain
+        self.top_k = config.top_k
+        self.ignore = {name.lower() for name in config.ignore}
+        self.exclude = exclude
+
+        self.top: list[Consumer] = []
+        self.hits: dict[int, str] = {}
+        self._charge: dict[int, int] = {}
+        self._over: dict[int, Consumer] = {}
+        self._own_pid = os.getpid()
+
+    def _rank(self, processes: Iterable[ProcessSample]) -> set[int]:
+        """
+        Updates the processes over a limit and picks the ``top_k``.
+
+        Returns:
+            set[int]: PIDs of every process in the table.
+        """
+        alive = set()
+        for proc in processes:
+            alive.add(proc.pid)
+            rss_mb = proc.rss / MB
+            score = max(proc.cpu / self.cpu_percent, rss_mb / self.rss_mb)
+            if (
+                score < 1
+                or proc.pid in {0, self._own_pid}
+                or proc.name.lower() in self.ignore
+                or (self.exclude is not None and self.exclude(proc.pid))
+            ):
+                self._over.pop(proc.pid, None)
+                continue
+            self._over[proc.pid] = Consumer(
+                score, proc.pid, proc.name, proc.cpu, rss_mb
+            )
+
+        for pid in self._over.keys() - alive:
+            del self._over[pid]
+        self.top = heapq.nlargest(self.top_k, self._over.values())
+        return alive
+
+    def update(self, processes: Iterable[ProcessSample]) -> dict[int, str]:
+        """
+        Runs one detection step.
+
+        Args:
+            processes (Iterable[ProcessSample]): The current process table.
+
+        Returns:
+            dict[int, str]: Name of each flagged process, by PID.
+        """
+        alive = self._rank(processes)
+        ranked = {consumer.pid: consumer.name for consumer in self.top}
+
+        for pid in ranked.keys() | self._charge.keys():
+            charge = self._charge.get(pid, 0) + (1 if pid in ranked else -1)
+            charge = min(charge, self.sustain)
+            if charge <= 0 or pid not in alive:
+                self._charge.pop(pid, None)
+                self.hits.pop(pid, None)
+                continue
+            self._charge[pid] = charge
+            if charge == self.sustain and pid in ranked:
+                self.hits[pid] = ranked[pid]
+        return self.hits
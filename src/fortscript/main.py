@@ -1,67 +1,186 @@
 import logging
 import os
-import subprocess
-import sys
+import signal
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Callable, TypedDict
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Callable, Iterable, TypedDict, TypeVar
 
 import psutil
 import yaml
 
+from .admission import AdmissionController
+from .checkpoint import CheckpointServer
+from .detector import AutoDetectConfig, ResourceDetector
+from .monitors import Monitor, default_monitors
+from .procscan import (
+    ProcessSample,
+    create_scanner,
+    process_names,
+    process_table,
+)
+from .reclaim import page_out, pageout_supported
+from .recorder import TimelineRecord, TimelineRecorder
+from .rules import Decision, RuleEngine
+from .sampler import SystemSampler
+from .spawn import EXIT_UNKNOWN, ProcessHandle, Spawner
+from .tree import ProjectTree, TreeTracker, wait_trees
+
 logger = logging.getLogger(__name__)
 
+_Config = TypeVar('_Config')
+
+# Seconds projects get to checkpoint, and then to exit, before being killed
+GRACE_PERIOD = 3
+
+# Seconds between two supervision checks
+CHECK_INTERVAL = 5
 
-class ProjectConfig(TypedDict):
+
+class _RequiredProjectConfig(TypedDict):
     name: str
     path: str
 
 
+class ProjectConfig(_RequiredProjectConfig, total=False):
+    priority: int
+
+
 class HeavyProcessConfig(TypedDict):
     name: str
     process: str
 
 
-class RamMonitoring:
+class RamMonitoring(Monitor):
     """Monitors RAM consumption."""
 
+    signals = ('ram', 'mem_available')
+
+    def __init__(self, sampler: SystemSampler | None = None):
+        """
+        Args:
+            sampler (SystemSampler, optional): Shared sampler to read the
+                memory status from instead of querying it directly.
+        """
+        self.sampler = sampler
+
+    def _virtual_memory(self) -> Any:
+        if self.sampler is not None:
+            return self.sampler.virtual_memory()
+        return psutil.virtual_memory()
+
     def get_percent(self) -> float:
         """Returns the current RAM usage percentage."""
-        return psutil.virtual_memory().percent
+        return self._virtual_memory().percent
 
+    def sample(self) -> dict[str, float]:
+        """Returns the RAM usage (%) and the available memory (MB)."""
+        memory = self._virtual_memory()
+        return {
+            'ram': memory.percent,
+            'mem_available': memory.available / (1024 * 1024),
+        }
 
-class AppsMonitoring:
+
+class AppsMonitoring(Monitor):
     """Monitors the opening of resource-heavy applications."""
 
-    def __init__(self, heavy_processes_list: list[HeavyProcessConfig]):
+    signals = ('heavy', 'auto_heavy')
+
+    def __init__(
+        self,
+        heavy_processes_list: list[HeavyProcessConfig],
+        backend: str = 'psutil',
+        sampler: SystemSampler | None = None,
+        detector: ResourceDetector | None = None,
+    ):
         """
         Initializes the application monitoring with a list of heavy processes.
 
         Args:
             heavy_processes_list (list[HeavyProcessConfig]): A list of
                 dictionaries containing process info.
+            backend (str): How processes are listed: ``'psutil'``,
+                ``'proc'`` (direct ``/proc`` scanning, Linux only) or
+                ``'auto'`` (``'proc'`` when available). Ignored when a
+                shared sampler is used.
+            sampler (SystemSampler, optional): Shared sampler to read the
+                process list from instead of scanning it directly.
+            detector (ResourceDetector, optional): Flags unlisted processes
+                with sustained high CPU or memory usage as heavy too.
         """
         self.heavy_processes_list = heavy_processes_list
-
-    def active_process_list(self) -> dict[str, bool]:
+        self.last_status: dict[str, bool] = {}
+        self.sampler = sampler
+        self.detector = detector
+
+        self._scanner = create_scanner(backend) if sampler is None else None
+        self.backend = 'psutil' if self._scanner is None else 'proc'
+
+    def process_names(self) -> list[str]:
+        """Returns the lowercase name of every running process."""
+        if self.sampler is not None:
+            return self.sampler.process_names()
+        return process_names(self._scanner)
+
+    def process_table(self) -> list[ProcessSample]:
+        """Returns the name and resource usage of every running process."""
+        if self.sampler is not None:
+            return self.sampler.processes()
+        return process_table(self._scanner)
+
+    def active_process_list(
+        self, names: Iterable[str] | None = None
+    ) -> dict[str, bool]:
         """
         Check which heavy processes from the list are currently running.
 
+        Args:
+            names (Iterable[str], optional): Lowercase names of the running
+                processes, if already listed.
+
         Returns:
             dict: A dictionary mapping process names to a boolean indicating if
              they are active.
         """
         status = {item['name']: False for item in self.heavy_processes_list}
-        for proc in psutil.process_iter(['name']):
-            try:
-                proc_name = proc.info.get('name', '').lower()
-                for item in self.heavy_processes_list:
-                    if item['process'].lower() in proc_name:
-                        status[item['name']] = True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        if not status:
+            return status
+
+        patterns = [
+            (item['name'], item['process'].lower())
+            for item in self.heavy_processes_list
+        ]
+        # Many processes share a name (workers, helpers), match each once
+        if names is None:
+            names = self.process_names()
+        for proc_name in set(names):
+            for name, process in patterns:
+                if process in proc_name:
+                    status[name] = True
         return status
 
+    def sample(self) -> dict[str, float]:
+        """
+        Returns whether any heavy process is running (``heavy``) and
+        whether the detector flagged one (``auto_heavy``, also counted as
+        ``heavy``).
+        """
+        if self.detector is None:
+            self.last_status = self.active_process_list()
+            auto_heavy = False
+        else:
+            # One table serves both the name matching and the detector
+            table = self.process_table()
+            self.last_status = self.active_process_list(
+                proc.name.lower() for proc in table
+            )
+            auto_heavy = bool(self.detector.update(table))
+        return {
+            'heavy': any(self.last_status.values()) or auto_heavy,
+            'auto_heavy': auto_heavy,
+        }
+
 
 @dataclass
 class RamConfig:
@@ -73,6 +192,47 @@ class RamConfig:
             self.safe = max(0, self.threshold - 10)
 
 
+@dataclass
+class RuleConfig:
+    """
+    Pause/resume expressions evaluated on every check.
+
+    Rules can use any monitor signal (``heavy``, ``auto_heavy``, ``ram``,
+    ``mem_available``, ``cpu``, ``swap``, ``swap_in``, ``swap_out``,
+    ``load``, ``disk_read``, ``disk_write``, ``disk_busy``) and the
+    ``threshold``/``safe`` values from :class:`RamConfig`.
+    """
+
+    pause: str = 'heavy or ram > safe'
+    resume: str = 'not heavy and ram < safe'
+
+
+@dataclass
+class AdmissionConfig:
+    """
+    Staggered resume settings.
+
+    Projects are started in ``priority`` order while the RAM usage, plus
+    the learned cost of the next project, stays ``margin`` points below
+    ``RamConfig.safe``. Projects never measured since FortScript started
+    are assumed to cost ``unknown_cost`` (%); with 0 they start one per
+    check.
+    """
+
+    enabled: bool = True
+    margin: float = 2.0
+    smoothing: float = 0.5
+    unknown_cost: float = 5.0
+
+
+@dataclass
+class TimelineConfig:
+    """Settings for the binary timeline of supervisor checks."""
+
+    path: str = 'fortscript.timeline'
+    capacity: int = 17280
+
+
 @dataclass
 class Callbacks:
     """Callback functions for script events."""
@@ -81,6 +241,19 @@ class Callbacks:
     on_resume: Callable | None = None
 
 
+@dataclass(frozen=True)
+class SupervisorState:
+    """Snapshot of the supervisor, safe to read from any thread."""
+
+    supervising: bool = False
+    script_running: bool = False
+    suspended: bool = False
+    projects: tuple[str, ...] = ()
+    decision: Decision | None = None
+    signals: dict[str, float] = field(default_factory=dict)
+    checked_at: float | None = None
+
+
 class FortScript:
     """Main class to manage scripts and monitor application status."""
 
@@ -93,6 +266,16 @@ class FortScript:
         callbacks: Callbacks | None = None,
         log_level: str | int | None = None,
         new_console: bool = True,
+        *,
+        rules: RuleConfig | None = None,
+        monitors: list[Monitor] | None = None,
+        process_backend: str | None = None,
+        admission: AdmissionConfig | None = None,
+        sampler: SystemSampler | None = None,
+        checkpoint: bool | None = None,
+        pause_mode: str | None = None,
+        timeline: TimelineConfig | None = None,
+        auto_detect: AutoDetectConfig | None = None,
     ):
         """
         Initializes FortScript with the configuration file and monitoring parameters.
@@ -107,12 +290,39 @@ class FortScript:
             callbacks (Callbacks, optional): Callback functions for events.
             log_level (str | int, optional): Severity level for logging.
             new_console (bool): If True, launches scripts in a separate console.
+            rules (RuleConfig, optional): Pause/resume rule expressions.
+            monitors (list[Monitor], optional): Extra monitors whose signals
+                can be used in the rules.
+            process_backend (str, optional): Process listing backend,
+                ``'psutil'`` (default), ``'proc'`` or ``'auto'``.
+            admission (AdmissionConfig, optional): Staggered resume
+                settings.
+            sampler (SystemSampler, optional): Shared sampler that runs
+                this instance together with other FortScript groups.
+            checkpoint (bool, optional): If True, projects are asked to
+                save their state before a pause and told when they resume
+                from it (see :mod:`fortscript.checkpoint`).
+            pause_mode (str, optional): ``'stop'`` (default) terminates
+                projects on pause. ``'pageout'`` freezes them and pushes
+                their memory to swap instead (Linux 5.10+).
+            timeline (TimelineConfig, optional): Records every check to a
+                timeline file for later inspection.
+            auto_detect (AutoDetectConfig, optional): Also pauses for
+                unlisted processes with sustained high CPU or memory usage.
         """
         self.new_console = new_console
+        self.config_path = config_path
         self.file_config = self.load_config(config_path)
 
-        self.active_processes: list[subprocess.Popen] = []
+        self.active_processes: list[ProcessHandle] = []
+        self._trees: dict[int, ProjectTree] = {}
+        self.suspended = False
+        self.script_running = False
+        self._first_check = True
 
+        # Settings passed as arguments are not touched by reload_config()
+        self._projects_from_file = projects is None
+        self._heavy_from_file = heavy_process is None
         self.projects: list[ProjectConfig] = (
             projects
             if projects is not None
@@ -126,13 +336,59 @@ class FortScript:
         if ram_config is None:
             self.ram_config = RamConfig(
                 threshold=self.file_config.get('ram_threshold', 95),
-                safe=self.file_config.get('ram_safe', 85)
+                safe=self.file_config.get('ram_safe', 85),
             )
         else:
             self.ram_config = ram_config
 
         self.callbacks = callbacks or Callbacks()
 
+        admission = (
+            admission
+            or self._file_section('admission', AdmissionConfig)
+            or AdmissionConfig()
+        )
+        self.admission_config = admission
+        self.admission = AdmissionController(
+            ceiling=self.ram_config.safe - admission.margin,
+            smoothing=admission.smoothing,
+            unknown_cost=admission.unknown_cost,
+        )
+
+        self._checkpoint = bool(
+            checkpoint
+            if checkpoint is not None
+            else self.file_config.get('checkpoint', False)
+        )
+        self.checkpoints: CheckpointServer | None = None
+        self._checkpointed: set[str] = set()
+
+        self.pause_mode = self._resolve_pause_mode(pause_mode)
+        self._thread: threading.Thread | None = None
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._stopped = threading.Event()
+        self._state_lock = threading.Lock()
+        self._state = SupervisorState()
+
+        self._timeline = (
+            timeline
+            if timeline is not None
+            else self._file_section('timeline', TimelineConfig)
+        )
+        self.recorder: TimelineRecorder | None = None
+        self.open()
+
+        if rules is None:
+            file_rules = self.file_config.get('rules') or {}
+            defaults = RuleConfig()
+            self.rule_config = RuleConfig(
+                pause=file_rules.get('pause', defaults.pause),
+                resume=file_rules.get('resume', defaults.resume),
+            )
+        else:
+            self.rule_config = rules
+
         # Set log level (Argument > Config > Default INFO)
         level = (
             log_level
@@ -142,9 +398,120 @@ class FortScript:
         logger.setLevel(level)
 
         self.is_windows = os.name == 'nt'
+        self.spawner = Spawner(new_console=new_console)
+        self.tree_tracker = TreeTracker()
+
+        self.apps_monitoring = AppsMonitoring(
+            self.heavy_processes,
+            backend=(
+                process_backend
+                if process_backend is not None
+                else self.file_config.get('process_backend', 'psutil')
+            ),
+            sampler=sampler,
+            detector=self._create_detector(auto_detect, sampler),
+        )
+        self.ram_monitoring = RamMonitoring(sampler)
+        self.rule_engine = RuleEngine(
+            pause=self.rule_config.pause,
+            resume=self.rule_config.resume,
+            monitors=[
+                *(monitors or []),
+                self.ram_monitoring,
+                self.apps_monitoring,
+                *(
+                    sampler.system_monitors()
+                    if sampler is not None
+                    else default_monitors()
+                ),
+            ],
+            constants={
+                'threshold': self.ram_config.threshold,
+                'safe': self.ram_config.safe,
+            },
+        )
 
-        self.apps_monitoring = AppsMonitoring(self.heavy_processes)
-        self.ram_monitoring = RamMonitoring()
+        if sampler is not None:
+            sampler.add(self)
+
+    def _resolve_pause_mode(self, pause_mode: str | None) -> str:
+        """Validates the pause mode (Argument > Config > Default 'stop')."""
+        if pause_mode is None:
+            pause_mode = self.file_config.get('pause_mode', 'stop')
+        if pause_mode not in {'stop', 'pageout'}:
+            raise ValueError(f'Unknown pause mode: {pause_mode!r}')
+        if pause_mode == 'pageout' and not pageout_supported():
+            logger.warning(
+                "The 'pageout' pause mode requires Linux 5.10+. "
+                "Falling back to 'stop'."
+            )
+            return 'stop'
+        return pause_mode
+
+    def _file_section(
+        self, key: str, config_type: type[_Config]
+    ) -> _Config | None:
+        """
+        Builds a settings dataclass from a section of the YAML file.
+
+        ``true``/``false`` toggle the feature, a mapping sets its fields.
+
+        Returns:
+            The settings, or None if the section is missing (or ``false``
+            for settings without an ``enabled`` field).
+
+        Raises:
+            ValueError: If the section has an invalid type or unknown keys.
+        """
+        value = self.file_config.get(key)
+        names = {f.name for f in fields(config_type)}
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            if 'enabled' in names:
+                return config_type(enabled=value)
+            return config_type() if value else None
+        if not isinstance(value, dict):
+            raise ValueError(f"'{key}' must be true, false or a mapping.")
+
+        unknown = sorted(set(value) - names)
+        if unknown:
+            raise ValueError(f"Unknown '{key}' settings: {unknown}")
+        return config_type(**value)
+
+    def open(self) -> None:
+        """
+        Opens the checkpoint server and the timeline, if enabled and not
+        already open. Done by :meth:`start` and :meth:`run`.
+        """
+        if self._checkpoint and self.checkpoints is None:
+            self.checkpoints = CheckpointServer()
+        if self._timeline is not None and self.recorder is None:
+            self.recorder = TimelineRecorder(
+                self._timeline.path, self._timeline.capacity
+            )
+
+    def _create_detector(
+        self,
+        auto_detect: AutoDetectConfig | None,
+        sampler: SystemSampler | None,
+    ) -> ResourceDetector | None:
+        """Creates the heavy process detector (Argument > Config > Off)."""
+        if auto_detect is None:
+            auto_detect = self._file_section('auto_detect', AutoDetectConfig)
+        if auto_detect is None or not auto_detect.enabled:
+            return None
+        # Projects of the other groups sharing the sampler aren't foreign
+        exclude = (
+            sampler.is_managed
+            if sampler is not None
+            else self.is_project_process
+        )
+        return ResourceDetector(auto_detect, exclude=exclude)
+
+    def is_project_process(self, pid: int) -> bool:
+        """Returns True if a process belongs to one of the projects."""
+        return any(tree.contains(pid) for tree in self._trees.values())
 
     def load_config(self, path: str) -> dict[str, Any]:
         """Loads the configuration from a YAML file. Returns empty dict if file fails."""
@@ -156,6 +523,24 @@ class FortScript:
             logger.warning(f'Could not load {path}: {e}')
         return {}
 
+    def reload_config(self) -> None:
+        """
+        Re-reads the YAML file and refreshes the project and heavy process
+        lists (unless they were passed as arguments).
+
+        Cached project launch details are discarded so changes take effect
+        on the next start.
+        """
+        self.file_config = self.load_config(self.config_path)
+        if self._projects_from_file:
+            self.projects = self.file_config.get('projects', [])
+        if self._heavy_from_file:
+            self.heavy_processes = (
+                self.file_config.get('heavy_processes') or []
+            )
+            self.apps_monitoring.heavy_processes_list = self.heavy_processes
+        self.spawner.invalidate()
+
     def start_scripts(self) -> None:
         """Starts all projects defined in the configuration."""
         self.active_processes = []  # Clear the list before starting
@@ -163,6 +548,27 @@ class FortScript:
         for project in self.projects:
             self._start_project(project)
 
+        self._notify_resume()
+
+    def _resume_scripts(self, ram: float) -> None:
+        """Queues every project and starts the first admitted ones."""
+        self.active_processes = []
+        self.admission.begin(self.projects)
+        self._admit_projects(ram)
+        self._notify_resume()
+
+    def _admit_projects(self, ram: float) -> None:
+        """Starts the pending projects that fit in the RAM headroom."""
+        for project in self.admission.admit(ram):
+            self._start_project(project)
+
+        if self.admission.pending:
+            logger.info(
+                f'{len(self.admission.pending)} project(s) waiting for '
+                f'RAM headroom (RAM: {ram}%).'
+            )
+
+    def _notify_resume(self) -> None:
         if self.callbacks.on_resume:
             try:
                 self.callbacks.on_resume()
@@ -181,116 +587,170 @@ class FortScript:
             )
             return
 
-        project_dir = os.path.dirname(script_path)
-        creation_flags = 0
-        if self.is_windows and self.new_console:
-            creation_flags = subprocess.CREATE_NEW_CONSOLE
+        spec = self.spawner.resolve(project_name, script_path)
+        if spec is None:
+            logger.warning(
+                f'The project {project_name} was skipped (invalid extension). '
+                'Try again with a script: [.py, .exe] or a Node.js project.'
+            )
+            return
 
-        # Check if the script is Python
-        if script_path.endswith('.py'):
-            try:
-                if self.is_windows:
-                    venv_python = os.path.join(
-                        project_dir, '.venv', 'Scripts', 'python.exe'
-                    )
-                else:
-                    venv_python = os.path.join(
-                        project_dir, '.venv', 'bin', 'python'
-                    )
+        extra_env = None
+        if self.checkpoints is not None:
+            extra_env = self.checkpoints.env(
+                project_name, resumed=project_name in self._checkpointed
+            )
+            self._checkpointed.discard(project_name)
 
-                python_exe = (
-                    venv_python
-                    if os.path.exists(venv_python)
-                    else sys.executable
-                )
+        try:
+            proc = self.spawner.spawn(spec, extra_env)
+            self.active_processes.append(proc)
+            self._trees[proc.pid] = self.tree_tracker.track(proc, project_name)
+            logger.info(f'Project started: {project_name} ({script_path})')
+            logger.debug(
+                f'{project_name} spawned in '
+                f'{self.spawner.latency[project_name]:.2f} ms'
+            )
+        except Exception as e:
+            logger.error(f'Error executing {project_name}: {e}')
 
-                proc = subprocess.Popen(
-                    [python_exe, script_path],
-                    creationflags=creation_flags,
-                )
-                self.active_processes.append(proc)
-                logger.info(f'Project started: {project_name} ({script_path})')
+    def stop_scripts(self, checkpoint: bool = True) -> None:
+        """
+        Terminates active scripts and their child processes.
 
-            except Exception as e:
-                logger.error(f'Error executing {project_name}: {e}')
+        Args:
+            checkpoint (bool): If True and checkpoints are enabled, projects
+                are asked to save their state first because this is a
+                temporary pause. Use False for a real shutdown.
+        """
+        if self.checkpoints is not None and checkpoint:
+            acked = self.checkpoints.checkpoint(timeout=GRACE_PERIOD)
+            if acked:
+                logger.info(f'Projects checkpointed: {sorted(acked)}')
+            # Projects still waiting for admission haven't run since their
+            # previous checkpoint, which is still valid
+            waiting = {
+                project.get('name', 'Unknown Project')
+                for project in self.admission.pending
+            }
+            self._checkpointed = acked | (self._checkpointed & waiting)
+        else:
+            self._checkpointed = set()
 
-        elif script_path.endswith('package.json'):
-            try:
-                command = ['npm', 'run', 'start']
-                if os.name == 'nt':
-                    command[0] = 'npm.cmd'
-
-                proc = subprocess.Popen(
-                    command,
-                    cwd=project_dir,
-                    creationflags=creation_flags,
-                )
-                self.active_processes.append(proc)
-                logger.info(f'Project: {project_name} started successfully!')
+        logger.info('Closing active scripts and their child processes...')
 
-            except Exception as e:
-                logger.error(f'Error executing {project_name}: {e}')
+        trees = self._all_trees()
 
-        # Invalid extension handling
-        elif script_path.endswith('.exe') and self.is_windows:
-            try:
-                command = ['cmd.exe', '/c', str(script_path)]
+        # Stopped processes only handle SIGTERM once continued
+        if self.suspended:
+            for tree in trees:
+                tree.send_signal(signal.SIGCONT)
+            self.suspended = False
 
-                proc = subprocess.Popen(
-                    command,
-                    cwd=str(project_dir),
-                    creationflags=creation_flags,
-                )
-                self.active_processes.append(proc)
+        # 1. Send terminate signal to each project tree
+        for tree in trees:
+            tree.terminate()
 
-            except Exception as e:
-                logger.error(f'Error executing {project_name}: {e}')
-        else:
+        # 2. Wait for the trees to exit (Graceful period)
+        # We give them 3 seconds to close connections, save state, etc.
+        alive = wait_trees(trees, timeout=GRACE_PERIOD)
+
+        # 3. Force kill if they are still alive
+        for tree in alive:
             logger.warning(
-                f'The project {project_name} was skipped (invalid extension). '
-                'Try again with a script: [.py, .exe] or a Node.js project.'
+                f'Project {tree.name} (PID: {tree.proc.pid}) did not exit. '
+                'Forcing kill.'
+            )
+            tree.kill()
+        alive = wait_trees(alive, timeout=GRACE_PERIOD)
+        for tree in alive:
+            logger.warning(
+                f'Project {tree.name} (PID: {tree.proc.pid}) is still '
+                'running after being killed.'
             )
 
-    def stop_scripts(self) -> None:
-        """Terminates active scripts and their child processes."""
-        logger.info('Closing active scripts and their child processes...')
+        self.active_processes = []
+        self._trees = {
+            pid: tree for pid, tree in self._trees.items() if tree in alive
+        }
+        for tree in trees:
+            if tree not in alive:
+                tree.release()
+        self.admission.cancel()
+        logger.info('All processes have been terminated.')
 
-        procs_to_kill = []
+        self._notify_pause()
 
-        # 1. Collect all processes (parents and children)
-        for proc in self.active_processes:
-            try:
-                parent_process = psutil.Process(proc.pid)
-                procs_to_kill.append(parent_process)
-                procs_to_kill.extend(parent_process.children(recursive=True))
-            except psutil.NoSuchProcess:
-                pass
+    def suspend_scripts(self) -> dict[str, int]:
+        """
+        Freezes every project tree and pages its memory out.
 
-        # 2. Send terminate signal (SIGTERM / CTRL_C_EVENT equivalent attempt)
-        for p in procs_to_kill:
-            try:
-                p.terminate()
-            except psutil.NoSuchProcess:
-                pass
+        Returns:
+            dict[str, int]: Bytes of resident memory reclaimed per project.
+        """
+        reclaimed = {}
+        for tree in self._all_trees():
+            tree.send_signal(signal.SIGSTOP)
+            members = tree.members()
+            self._wait_stopped(members)
+
+            before = tree.rss()
+            for p in members:
+                try:
+                    page_out(p.pid)
+                except OSError as e:
+                    logger.warning(
+                        f'Could not page out {tree.name} (PID {p.pid}): {e}'
+                    )
+            reclaimed[tree.name] = max(0, before - tree.rss())
+            logger.info(
+                f'Project suspended: {tree.name} '
+                f'({reclaimed[tree.name] / (1024 * 1024):.1f} MB reclaimed)'
+            )
 
-        # 3. Wait for processes to exit (Graceful period)
-        # We give them 3 seconds to close connections, save state, etc.
-        gone, alive = psutil.wait_procs(procs_to_kill, timeout=3)
+        self.suspended = True
+        self._notify_pause()
+        return reclaimed
 
-        # 4. Force kill if they are still alive
-        for p in alive:
+    def resume_suspended(self) -> None:
+        """Continues the project trees frozen by :meth:`suspend_scripts`."""
+        for tree in self._all_trees():
+            tree.send_signal(signal.SIGCONT)
+            logger.info(f'Project resumed: {tree.name}')
+
+        self.suspended = False
+        self._notify_resume()
+
+    def _all_trees(self) -> list[ProjectTree]:
+        """
+        Returns every project tree, including trees whose leader already
+        exited but that still hold processes.
+        """
+        for proc in self.active_processes:
+            self._tree(proc)
+        return list(self._trees.values())
+
+    def _tree(self, proc: ProcessHandle) -> ProjectTree:
+        """Returns the tree of a project process."""
+        if proc.pid not in self._trees:
+            self._trees[proc.pid] = ProjectTree(proc, f'PID {proc.pid}')
+        return self._trees[proc.pid]
+
+    @staticmethod
+    def _wait_stopped(tree: list[psutil.Process], timeout: float = 1) -> None:
+        """Waits until SIGSTOP has been delivered to the whole tree."""
+        deadline = time.monotonic() + timeout
+        pending = list(tree)
+        while pending and time.monotonic() < deadline:
             try:
-                logger.warning(
-                    f'Process {p.name()} (PID: {p.pid}) did not exit. '
-                    'Forcing kill.'
-                )
-                p.kill()
-            except psutil.NoSuchProcess:
+                if pending[0].status() != psutil.STATUS_STOPPED:
+                    time.sleep(0.005)
+                    continue
+            except psutil.Error:
                 pass
+            pending.pop(0)
 
-        self.active_processes = []
-        logger.info('All processes have been terminated.')
-
+    def _notify_pause(self) -> None:
         if self.callbacks.on_pause:
             try:
                 self.callbacks.on_pause()
@@ -299,72 +759,203 @@ class FortScript:
 
     def process_manager(self) -> None:
         """Manages scripts based on heavy process activity and RAM usage."""
-        script_running = False
-        first_check = True
+        while not self._stopping.is_set():
+            # Cleared before the check, so a poke during it isn't lost
+            self._wake.clear()
+            self.tick()
+            self._wake.wait(CHECK_INTERVAL)
 
-        while True:
-            status_dict = self.apps_monitoring.active_process_list()
-            is_heavy_open = any(status_dict.values())
+    def start(self) -> None:
+        """
+        Starts supervising on a background thread and returns immediately.
 
-            current_ram = self.ram_monitoring.get_percent()
-            is_ram_critical = current_ram > self.ram_config.safe
+        Does nothing if the supervisor is already running.
+        """
+        if self._thread is not None:
+            return
+        self.open()
+        self._stopping.clear()
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._supervise,
+            name='fortscript-supervisor',
+            daemon=True,
+        )
+        self._thread.start()
 
-            # Initial feedback
-            if first_check and (is_heavy_open or is_ram_critical):
-                reason = 'heavy processes' if is_heavy_open else 'high RAM'
-                logger.info(
-                    f'System is busy ({reason}). Waiting for stabilization...'
-                )
-                first_check = False
+    def _supervise(self) -> None:
+        """Runs the supervision loop, then marks the supervisor stopped."""
+        try:
+            self.process_manager()
+        finally:
+            if self._thread is threading.current_thread():
+                self._thread = None
+            self._stopped.set()
 
-            # Stop Condition
-            if (is_heavy_open or is_ram_critical) and script_running:
-                self._handle_stop_condition(
-                    is_heavy_open, status_dict, current_ram
-                )
-                script_running = False
-
-            # Start Condition
-            elif (
-                not is_heavy_open
-                and not is_ram_critical
-                and not script_running
-                and current_ram < self.ram_config.safe
-            ):
-                self._handle_start_condition(current_ram)
-                script_running = True
-                first_check = False
-
-            # Dead Process Handling
-            if script_running and self.active_processes:
-                script_running = self._check_dead_processes(script_running)
-
-            time.sleep(5)
-
-    def _handle_stop_condition(
+    def stop(self) -> None:
+        """
+        Stops the supervisor, terminates the projects and closes the
+        checkpoint server and the timeline.
+
+        Waits for a check in progress to finish, but not for the interval
+        between checks. The supervisor can be started again afterwards.
+        """
+        self._stopping.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            self._stopped.wait()
+
+        if self.active_processes or self._trees:
+            self.stop_scripts(checkpoint=False)
+        self.script_running = False
+        self._publish_state()
+        self.close()
+
+    def poke(self) -> None:
+        """Runs the next check right away instead of after the interval."""
+        self._wake.set()
+
+    def state(self) -> SupervisorState:
+        """Returns a snapshot of the supervisor state."""
+        with self._state_lock:
+            state = self._state
+        return replace(state, supervising=self._thread is not None)
+
+    def _publish_state(
         self,
-        is_heavy_open: bool,
-        status_dict: dict[str, bool],
-        current_ram: float,
+        decision: Decision | None = None,
+        signals: dict[str, float] | None = None,
     ) -> None:
-        if is_heavy_open:
-            detected = [k for k, v in status_dict.items() if v]
-            logger.warning(
-                f'Closing scripts due to heavy processes: {detected}'
+        """
+        Replaces the snapshot returned by :meth:`state`.
+
+        Reads the project trees, so it must only be called by the
+        supervisor thread, or once it has stopped.
+        """
+        with self._state_lock:
+            state = self._state
+            if signals is not None:
+                state = replace(
+                    state,
+                    decision=decision,
+                    signals=dict(signals),
+                    checked_at=time.time(),
+                )
+            self._state = replace(
+                state,
+                script_running=self.script_running,
+                suspended=self.suspended,
+                projects=tuple(tree.name for tree in self._trees.values()),
+            )
+
+    def tick(self) -> Decision:
+        """
+        Runs a single supervision step.
+
+        Returns:
+            Decision: The action taken during this step.
+        """
+        started = time.perf_counter()
+        signals = self.rule_engine.sample()
+        sampled = time.perf_counter()
+        decision = self.rule_engine.decide(signals, self.script_running)
+
+        # Initial feedback
+        if self._first_check and self.rule_engine.pause.evaluate(signals):
+            logger.info(
+                f'System is busy ({self._pause_reason(signals)}). '
+                'Waiting for stabilization...'
+            )
+            self._first_check = False
+
+        # Stop Condition
+        if decision == Decision.PAUSE:
+            self._handle_stop_condition(signals)
+            self.script_running = False
+
+        # Start Condition
+        elif decision == Decision.RESUME:
+            self._handle_start_condition(signals)
+            self.script_running = True
+            self._first_check = False
+
+        # Staggered Resume
+        elif self.script_running and self.admission.pending:
+            self._admit_projects(self._current_ram(signals))
+        # Measures the last batch once every project was admitted
+        elif self.script_running and self.admission.settling:
+            self.admission.settle(self._current_ram(signals))
+        acted = time.perf_counter()
+
+        # Dead Process Handling
+        if self.script_running and (self.active_processes or self._trees):
+            self.script_running = self._check_dead_processes(
+                self.script_running
             )
+
+        if self.recorder is not None:
+            self.recorder.record(
+                TimelineRecord(
+                    timestamp=time.time(),
+                    ram=signals.get('ram'),
+                    heavy=signals.get('heavy'),
+                    decision=decision,
+                    running=self.script_running,
+                    sample_ms=(sampled - started) * 1000,
+                    action_ms=(acted - sampled) * 1000,
+                )
+            )
+        self._publish_state(decision, signals)
+        return decision
+
+    def _pause_reason(self, signals: dict[str, float]) -> str:
+        """Describes which signal triggered the pause rule."""
+        if signals.get('heavy'):
+            detected = [
+                k for k, v in self.apps_monitoring.last_status.items() if v
+            ]
+            detector = self.apps_monitoring.detector
+            if detector is not None and detector.hits:
+                detected += [
+                    f'{name} (PID {pid})'
+                    for pid, name in detector.hits.items()
+                ]
+            return f'heavy processes: {detected}'
+        if signals.get('ram', 0) > self.ram_config.safe:
+            return f'high RAM usage: {signals["ram"]}%'
+        return f'pause rule: {self.rule_engine.pause.expression}'
+
+    def _handle_stop_condition(self, signals: dict[str, float]) -> None:
+        logger.warning(f'Closing scripts due to {self._pause_reason(signals)}')
+
+        if self.pause_mode == 'pageout':
+            self.suspend_scripts()
+            logger.info('Scripts suspended.')
         else:
-            logger.warning(
-                f'Closing scripts due to high RAM usage: {current_ram}%'
+            self.stop_scripts()
+            logger.info('Scripts stopped.')
+
+    def _handle_start_condition(self, signals: dict[str, float]) -> None:
+        if 'ram' in signals:
+            logger.info(
+                f'System stable (RAM: {signals["ram"]}%). Starting scripts...'
             )
+        else:
+            logger.info('System stable. Starting scripts...')
 
-        self.stop_scripts()
-        logger.info('Scripts stopped.')
+        if self.suspended:
+            self.resume_suspended()
+        elif self.admission_config.enabled:
+            self._resume_scripts(self._current_ram(signals))
+        else:
+            self.start_scripts()
 
-    def _handle_start_condition(self, current_ram: float) -> None:
-        logger.info(
-            f'System stable (RAM: {current_ram}%). Starting scripts...'
-        )
-        self.start_scripts()
+    def _current_ram(self, signals: dict[str, float]) -> float:
+        """Returns the RAM usage (%), sampling it if no rule needed it."""
+        if 'ram' in signals:
+            return signals['ram']
+        return self.ram_monitoring.get_percent()
 
     def _check_dead_processes(self, script_running: bool) -> bool:
         alive_processes = []
@@ -376,6 +967,10 @@ class FortScript:
                 logger.info(
                     f'Process (PID: {proc.pid}) finished successfully.'
                 )
+            elif ret_code == EXIT_UNKNOWN:
+                logger.warning(
+                    f'Process (PID: {proc.pid}) exited with an unknown status.'
+                )
             else:
                 logger.warning(
                     f'Process (PID: {proc.pid}) crashed/exited '
@@ -384,11 +979,57 @@ class FortScript:
 
         self.active_processes = alive_processes
 
-        if not self.active_processes:
+        # Keep the tree of an exited project until its last process is gone
+        running = {proc.pid for proc in self.active_processes}
+        for pid, tree in list(self._trees.items()):
+            if pid not in running and not tree.is_alive():
+                tree.release()
+                del self._trees[pid]
+
+        # Leftover processes keep the projects running, so a pause still
+        # stops them
+        if (
+            not self.active_processes
+            and not self._trees
+            and not self.admission.pending
+        ):
             logger.info('All scripts finished. Waiting for system changes...')
             return False
         return script_running
 
     def run(self) -> None:
-        """Runs the main application loop."""
-        self.process_manager()
+        """
+        Runs the main application loop, blocking until :meth:`stop` is
+        called from another thread or the process is interrupted. Use
+        :meth:`start` to run it in the background instead.
+
+        Raises:
+            RuntimeError: If the supervisor is already running.
+        """
+        if self._thread is not None:
+            raise RuntimeError('The supervisor is already running')
+        self.open()
+        self._stopping.clear()
+        self._stopped.clear()
+        self._thread = threading.current_thread()
+        try:
+            self._supervise()
+        except KeyboardInterrupt:
+            # Projects run in their own sessions and don't get the
+            # terminal's Ctrl+C, so they have to be stopped here
+            logger.info('Interrupted, stopping projects...')
+            self.stop()
+            raise
+
+    def close(self) -> None:
+        """
+        Closes the checkpoint server and the timeline. Called by
+        :meth:`stop`; they are opened again by :meth:`start` and
+        :meth:`run`.
+        """
+        if self.checkpoints is not None:
+            self.checkpoints.close()
+            self.checkpoints = None
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
@@ -0,0 +1,152 @@
+"""
+System signal monitors used by the rule engine.
+
+Every monitor publishes one or more named signals (e.g. ``cpu`` or
+``swap_out``). The rule engine only samples the monitors whose signals are
+referenced by an active rule, so unused monitors cost nothing.
+"""
+
+import time
+from abc import ABC, abstractmethod
+
+import psutil
+
+
+class Monitor(ABC):
+    """Base class for pluggable signal monitors."""
+
+    #: Names of the signals returned by :meth:`sample`.
+    signals: tuple[str, ...] = ()
+
+    @abstractmethod
+    def sample(self) -> dict[str, float]:
+        """
+        Reads the current value of every signal provided by the monitor.
+
+        Returns:
+            dict: A dictionary mapping signal names to their current values.
+        """
+
+
+class _RateMonitor(Monitor):
+    """Helper for monitors that turn cumulative counters into rates."""
+
+    def __init__(self):
+        self._last_counters: tuple[float, ...] | None = None
+        self._last_time = 0.0
+
+    def _deltas(
+        self, counters: tuple[float, ...]
+    ) -> tuple[tuple[float, ...], float]:
+        """Returns the counter deltas and elapsed seconds since last call."""
+        now = time.monotonic()
+        previous, elapsed = self._last_counters, now - self._last_time
+        self._last_counters, self._last_time = counters, now
+
+        if previous is None or elapsed <= 0:
+            return tuple(0.0 for _ in counters), 0.0
+        return (
+            tuple(max(0.0, c - p) for c, p in zip(counters, previous)),
+            elapsed,
+        )
+
+
+class CpuMonitoring(_RateMonitor):
+    """
+    Monitors CPU usage averaged since the previous sample.
+
+    ``psutil.cpu_percent(interval=None)`` keeps a single process-wide
+    baseline, so several instances (one per FortScript group) would measure
+    over near-zero intervals. Each instance keeps its own CPU times instead.
+    """
+
+    signals = ('cpu',)
+
+    def __init__(self):
+        super().__init__()
+        self._deltas(self._cpu_times())
+
+    @staticmethod
+    def _cpu_times() -> tuple[float, float]:
+        """Returns the total and idle CPU seconds of the system."""
+        times = psutil.cpu_times()
+        # Guest time is already counted in user time on Linux
+        total = (
+            sum(times)
+            - getattr(times, 'guest', 0.0)
+            - getattr(times, 'guest_nice', 0.0)
+        )
+        idle = times.idle + getattr(times, 'iowait', 0.0)
+        return total, idle
+
+    def sample(self) -> dict[str, float]:
+        (total, idle), _ = self._deltas(self._cpu_times())
+        if not total:
+            return {'cpu': 0.0}
+        return {'cpu': min(100.0, max(0.0, 100 * (1 - idle / total)))}
+
+
+class SwapMonitoring(_RateMonitor):
+    """Monitors swap usage and swap-in/swap-out activity (MB/s)."""
+
+    signals = ('swap', 'swap_in', 'swap_out')
+
+    def sample(self) -> dict[str, float]:
+        swap = psutil.swap_memory()
+        (sin, sout), elapsed = self._deltas((swap.sin, swap.sout))
+        mb_per_sec = 1 / (1024 * 1024 * elapsed) if elapsed else 0.0
+        return {
+            'swap': swap.percent,
+            'swap_in': sin * mb_per_sec,
+            'swap_out': sout * mb_per_sec,
+        }
+
+
+class LoadMonitoring(Monitor):
+    """Monitors the 1-minute load average normalized by the CPU count."""
+
+    signals = ('load',)
+
+    def __init__(self):
+        self.cpu_count = psutil.cpu_count() or 1
+
+    def sample(self) -> dict[str, float]:
+        return {'load': psutil.getloadavg()[0] / self.cpu_count}
+
+
+class DiskIOMonitoring(_RateMonitor):
+    """Monitors disk throughput (MB/s) and busy time (%)."""
+
+    signals = ('disk_read', 'disk_write', 'disk_busy')
+
+    def sample(self) -> dict[str, float]:
+        io = psutil.disk_io_counters()
+        if io is None:
+            return dict.fromkeys(self.signals, 0.0)
+
+        # busy_time is only available on Linux/FreeBSD, approximate it
+        # with the time spent reading and writing elsewhere
+        busy_ms = getattr(io, 'busy_time', io.read_time + io.write_time)
+        (read, write, busy), elapsed = self._deltas((
+            io.read_bytes,
+            io.write_bytes,
+            busy_ms,
+        ))
+        if not elapsed:
+            return dict.fromkeys(self.signals, 0.0)
+
+        return {
+            'disk_read': read / (1024 * 1024 * elapsed),
+            'disk_write': write / (1024 * 1024 * elapsed),
+            'disk_busy': min(100.0, busy / (10 * elapsed)),
+        }
+
+
+def default_monitors() -> list[Monitor]:
+    """Returns the built-in monitors that are not tied to FortScript state."""
+    return [
+        CpuMonitoring(),
+        SwapMonitoring(),
+        LoadMonitoring(),
+        DiskIOMonitoring(),
+    ]
@@ -0,0 +1,236 @@
+"""
+Lightweight process name scanner for Linux.
+
+``psutil.process_iter`` creates a ``Process`` object per PID (and reads
+``/proc/<pid>/stat`` to identify it) just to return its name. This scanner
+reads ``/proc/<pid>/comm`` directly, relative to an open ``/proc`` handle,
+into a reused buffer. The happy path raises no exceptions; only PIDs that
+vanish mid-scan or deny access take the ``OSError`` path.
+
+:meth:`ProcScanner.processes` reads ``/proc/<pid>/stat`` instead, which
+also holds the CPU times and resident memory used by the heavy process
+detector, so one scan serves both.
+"""
+
+import logging
+import os
+import sys
+import time
+from typing import NamedTuple
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+PROC_ROOT = '/proc'
+
+# The kernel truncates ``comm`` to 15 characters (TASK_COMM_LEN - 1)
+_COMM_LEN = 15
+
+
+def proc_scan_supported(root: str = PROC_ROOT) -> bool:
+    """Returns True if ``/proc`` scanning can be used on this system."""
+    return sys.platform.startswith('linux') and os.path.isdir(root)
+
+
+class ProcessSample(NamedTuple):
+    """Resource usage of one process."""
+
+    pid: int
+    name: str
+    cpu: float  # Percent since the previous scan, 100 is one full core
+    rss: int  # Bytes
+
+
+class ProcScanner:
+    """Lists process names by reading ``/proc`` directly."""
+
+    def __init__(self, root: str = PROC_ROOT, cmdline: bool = True):
+        """
+        Args:
+            root (str): Mount point of the proc filesystem.
+            cmdline (bool): If True, names truncated by the kernel are
+                completed from ``/proc/<pid>/cmdline``, like psutil does.
+        """
+        self.root = root
+        self.cmdline = cmdline
+        self._buffer = bytearray(4096)
+        self._view = memoryview(self._buffer)
+
+        # CPU ticks of each process at the previous ``processes`` scan
+        self._cpu_ticks: dict[int, int] = {}
+        self._scanned_at: float | None = None
+        if hasattr(os, 'sysconf'):
+            self._clock_ticks = os.sysconf('SC_CLK_TCK')
+            self._page_size = os.sysconf('SC_PAGE_SIZE')
+
+    def _read(self, path: str, dir_fd: int) -> bytes | None:
+        """Reads a small proc file into the shared buffer."""
+        try:
+            fd = os.open(path, os.O_RDONLY, dir_fd=dir_fd)
+        except OSError:
+            return None
+        try:
+            size = os.readv(fd, [self._buffer])
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+        return self._view[:size].tobytes()
+
+    def _name(self, pid: str, dir_fd: int) -> str | None:
+        comm = self._read(f'{pid}/comm', dir_fd)
+        if comm is None:
+            return None
+        return self._complete(os.fsdecode(comm.rstrip(b'\n')), pid, dir_fd)
+
+    def _complete(self, name: str, pid: str, dir_fd: int) -> str:
+        """Completes a name truncated by the kernel from the cmdline."""
+        if self.cmdline and len(name) >= _COMM_LEN:
+            cmdline = self._read(f'{pid}/cmdline', dir_fd)
+            if cmdline:
+                exe = os.path.basename(os.fsdecode(cmdline.split(b'\0', 1)[0]))
+                if exe.startswith(name):
+                    name = exe
+        return name
+
+    def names(self) -> list[str]:
+        """
+        Returns the name of every running process.
+
+        Returns:
+            list[str]: Process names, as reported by ``psutil.Process.name``.
+        """
+        names = []
+        dir_fd = os.open(self.root, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            with os.scandir(dir_fd) as entries:
+                for entry in entries:
+                    pid = entry.name
+                    if not pid.isdigit():
+                        continue
+                    name = self._name(pid, dir_fd)
+                    if name is not None:
+                        names.append(name)
+        finally:
+            os.close(dir_fd)
+        return names
+
+    def _stat(self, pid: str, dir_fd: int) -> tuple[str, int, int] | None:
+        """Returns the name, CPU ticks and resident bytes of a process."""
+        stat = self._read(f'{pid}/stat', dir_fd)
+        if stat is None:
+            return None
+        # The name is in parentheses and may itself contain spaces
+        end = stat.rfind(b')')
+        name = os.fsdecode(stat[stat.find(b'(') + 1 : end])
+        fields = stat[end + 2 :].split()
+        ticks = int(fields[11]) + int(fields[12])  # utime + stime
+        rss = int(fields[21]) * self._page_size
+        return self._complete(name, pid, dir_fd), ticks, rss
+
+    def processes(self) -> list[ProcessSample]:
+        """
+        Returns the name and resource usage of every running process.
+
+        The CPU usage is measured since the previous call, like
+        ``psutil.Process.cpu_percent``; it is 0 on the first call.
+
+        Returns:
+            list[ProcessSample]: One sample per process.
+        """
+        now = time.monotonic()
+        elapsed = 0.0 if self._scanned_at is None else now - self._scanned_at
+        previous, self._cpu_ticks = self._cpu_ticks, {}
+        self._scanned_at = now
+
+        samples = []
+        dir_fd = os.open(self.root, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            with os.scandir(dir_fd) as entries:
+                for entry in entries:
+                    if not entry.name.isdigit():
+                        continue
+                    stat = self._stat(entry.name, dir_fd)
+                    if stat is None:
+                        continue
+                    name, ticks, rss = stat
+                    pid = int(entry.name)
+                    self._cpu_ticks[pid] = ticks
+
+                    cpu = 0.0
+                    if pid in previous and elapsed > 0:
+                        used = max(0, ticks - previous[pid])
+                        cpu = used / self._clock_ticks / elapsed * 100
+                    samples.append(ProcessSample(pid, name, cpu, rss))
+        finally:
+            os.close(dir_fd)
+        return samples
+
+
+def create_scanner(backend: str) -> ProcScanner | None:
+    """
+    Creates the scanner for a process listing backend.
+
+    Args:
+        backend (str): ``'psutil'``, ``'proc'`` or ``'auto'``.
+
+    Returns:
+        ProcScanner | None: A scanner, or None when psutil should be used.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if backend not in {'psutil', 'proc', 'auto'}:
+        raise ValueError(f'Unknown process backend: {backend!r}')
+    if backend == 'psutil':
+        return None
+    if proc_scan_supported():
+        return ProcScanner()
+    if backend == 'proc':
+        logger.warning(
+            "The 'proc' process backend is only available on Linux. "
+            'Falling back to psutil.'
+        )
+    return None
+
+
+def process_names(scanner: ProcScanner | None = None) -> list[str]:
+    """
+    Returns the lowercase name of every running process.
+
+    Args:
+        scanner (ProcScanner, optional): Scanner to use instead of psutil.
+    """
+    if scanner is not None:
+        return [name.lower() for name in scanner.names()]
+
+    names = []
+    for proc in psutil.process_iter(['name']):
+        names.append((proc.info.get('name') or '').lower())
+    return names
+
+
+def process_table(scanner: ProcScanner | None = None) -> list[ProcessSample]:
+    """
+    Returns the name and resource usage of every running process.
+
+    Args:
+        scanner (ProcScanner, optional): Scanner to use instead of psutil.
+    """
+    if scanner is not None:
+        return scanner.processes()
+
+    samples = []
+    for proc in psutil.process_iter(['name', 'cpu_percent', 'memory_info']):
+        info = proc.info
+        memory = info['memory_info']
+        samples.append(
+            ProcessSample(
+                proc.pid,
+                info['name'] or '',
+                info['cpu_percent'] or 0.0,
+                memory.rss if memory else 0,
+            )
+        )
+    return samples
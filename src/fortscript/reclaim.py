@@ -0,0 +1,139 @@
+"""
+Memory reclaim for suspended projects (Linux 5.10+).
+
+Instead of killing a project to free RAM, its process tree can be frozen and
+its anonymous memory pushed to swap/zram with
+``process_madvise(MADV_PAGEOUT)``. The pages fault back in lazily once the
+project is resumed, so its warm state survives the pause.
+
+Advising another process requires ptrace access to it and, on most kernels,
+the ``CAP_SYS_NICE`` capability.
+"""
+
+import ctypes
+import functools
+import os
+import platform
+import sys
+
+MADV_PAGEOUT = 21
+
+# process_madvise uses the unified syscall number on these architectures
+_SYS_PROCESS_MADVISE = 440
+_SUPPORTED_MACHINES = {
+    'x86_64',
+    'amd64',
+    'i386',
+    'i686',
+    'aarch64',
+    'arm64',
+    'armv7l',
+    'riscv64',
+    'ppc64le',
+    's390x',
+}
+
+# Maximum number of ranges per call (UIO_MAXIOV)
+_MAX_IOV = 1024
+
+# Lines of /proc/<pid>/maps have 6 fields when the mapping has a name
+_MAPS_FIELDS = 6
+_ANONYMOUS_NAMES = (b'[heap]', b'[stack', b'[anon')
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+
+def _kernel_version() -> tuple[int, int]:
+    try:
+        major, minor = platform.release().split('.')[:2]
+        return int(major), int(''.join(c for c in minor if c.isdigit()))
+    except ValueError:
+        return 0, 0
+
+
+def pageout_supported() -> bool:
+    """Returns True if process_madvise page-out can be used here."""
+    return (
+        sys.platform.startswith('linux')
+        and hasattr(os, 'pidfd_open')
+        and platform.machine().lower() in _SUPPORTED_MACHINES
+        and _kernel_version() >= (5, 10)
+    )
+
+
+def anonymous_ranges(pid: int) -> list[tuple[int, int]]:
+    """
+    Lists the private anonymous mappings of a process.
+
+    Args:
+        pid (int): The process ID.
+
+    Returns:
+        list[tuple[int, int]]: ``(start, length)`` of each mapping.
+    """
+    ranges = []
+    with open(f'/proc/{pid}/maps', 'rb') as maps:
+        for line in maps:
+            fields = line.split(maxsplit=_MAPS_FIELDS - 1)
+            address, perms, inode = fields[0], fields[1], fields[4]
+            path = fields[5].strip() if len(fields) == _MAPS_FIELDS else b''
+
+            # Readable, private, and not backed by a file
+            if inode != b'0' or perms[0:1] != b'r' or perms[3:4] != b'p':
+                continue
+            if path and not path.startswith(_ANONYMOUS_NAMES):
+                continue
+            start, end = (int(x, 16) for x in address.split(b'-'))
+            ranges.append((start, end - start))
+    return ranges
+
+
+@functools.cache
+def _libc() -> ctypes.CDLL:
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.syscall.restype = ctypes.c_long
+    return libc
+
+
+def page_out(pid: int) -> int:
+    """
+    Asks the kernel to page out the anonymous memory of a process.
+
+    The process should be stopped first, otherwise it will fault the pages
+    back in right away.
+
+    Args:
+        pid (int): The process ID.
+
+    Returns:
+        int: Number of bytes the kernel accepted to advise.
+
+    Raises:
+        OSError: If the process is gone or access is denied.
+    """
+    ranges = anonymous_ranges(pid)
+    libc = _libc()
+    advised = 0
+
+    pidfd = os.pidfd_open(pid)
+    try:
+        for offset in range(0, len(ranges), _MAX_IOV):
+            chunk = ranges[offset : offset + _MAX_IOV]
+            iovecs = (_IOVec * len(chunk))(*chunk)
+            result = libc.syscall(
+                ctypes.c_long(_SYS_PROCESS_MADVISE),
+                ctypes.c_int(pidfd),
+                iovecs,
+                ctypes.c_size_t(len(chunk)),
+                ctypes.c_int(MADV_PAGEOUT),
+                ctypes.c_uint(0),
+            )
+            if result < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno))
+            advised += result
+    finally:
+        os.close(pidfd)
+    return advised
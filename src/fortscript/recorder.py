@@ -0,0 +1,195 @@
+"""
+Compact timeline of supervisor samples and decisions.
+
+Every check is stored as a fixed-width binary record in a memory-mapped ring
+file, so recording can stay enabled permanently: writes are a single
+``struct.pack_into`` into the mapping, with no syscalls and no fsync. When
+the ring is full, the oldest records are overwritten.
+
+File layout::
+
+    header  (28 bytes): magic, version, record size, capacity, total written,
+                        padding
+    records (24 bytes each): timestamp, ram, sample_ms, action_ms,
+                             heavy, decision, running, padding
+"""
+
+import csv
+import json
+import math
+import mmap
+import os
+import struct
+from typing import IO, NamedTuple
+
+from .rules import Decision
+
+MAGIC = b'FSTL'
+VERSION = 1
+
+_HEADER = struct.Struct('<4sHHIQ8x')
+_COUNT = struct.Struct('<Q')
+_COUNT_OFFSET = 12
+_RECORD = struct.Struct('<dfffBBBx')
+
+# Marker stored in the ``heavy`` field when the signal was not sampled
+_UNKNOWN = 255
+
+
+class TimelineRecord(NamedTuple):
+    """A single supervisor check read back from a timeline file."""
+
+    timestamp: float
+    ram: float | None
+    heavy: bool | None
+    decision: Decision
+    running: bool
+    sample_ms: float
+    action_ms: float
+
+
+class TimelineRecorder:
+    """Appends supervisor checks to a memory-mapped ring file."""
+
+    def __init__(self, path: str, capacity: int = 17280):
+        """
+        Opens (or creates) a timeline file.
+
+        An existing file with the same capacity is appended to, otherwise it
+        is recreated.
+
+        Args:
+            path (str): Location of the timeline file.
+            capacity (int): Maximum number of records kept. The default
+                holds 24 hours of checks at the 5 second interval.
+        """
+        if capacity <= 0:
+            raise ValueError('Timeline capacity must be positive.')
+
+        self.path = path
+        self.capacity = capacity
+        size = _HEADER.size + capacity * _RECORD.size
+
+        # O_BINARY keeps Windows from translating the header bytes
+        flags = os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+        fd = os.open(path, flags, 0o644)
+        try:
+            header = os.read(fd, _HEADER.size)
+            count = _parse_count(header, capacity)
+            if count is None or os.fstat(fd).st_size != size:
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+                count = 0
+            self._mm = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        _HEADER.pack_into(
+            self._mm, 0, MAGIC, VERSION, _RECORD.size, capacity, count
+        )
+        self._count = count
+
+    def record(self, check: TimelineRecord) -> None:
+        """
+        Appends one check to the ring.
+
+        Args:
+            check (TimelineRecord): The check to store. ``ram`` and
+                ``heavy`` are None when the signal was not sampled.
+        """
+        offset = _HEADER.size + (self._count % self.capacity) * _RECORD.size
+        _RECORD.pack_into(
+            self._mm,
+            offset,
+            check.timestamp,
+            math.nan if check.ram is None else check.ram,
+            check.sample_ms,
+            check.action_ms,
+            _UNKNOWN if check.heavy is None else bool(check.heavy),
+            check.decision,
+            check.running,
+        )
+        self._count += 1
+        _COUNT.pack_into(self._mm, _COUNT_OFFSET, self._count)
+
+    def close(self) -> None:
+        """Unmaps the file. Pending pages are written back by the OS."""
+        self._mm.close()
+
+
+def _parse_count(header: bytes, capacity: int | None) -> int | None:
+    """Returns the record count stored in a valid header, else None."""
+    if len(header) < _HEADER.size:
+        return None
+    magic, version, record_size, file_capacity, count = _HEADER.unpack(header)
+    if (
+        magic != MAGIC
+        or version != VERSION
+        or record_size != _RECORD.size
+        or (capacity is not None and file_capacity != capacity)
+    ):
+        return None
+    return count
+
+
+def read_timeline(path: str) -> list[TimelineRecord]:
+    """
+    Reads every record still stored in a timeline file, oldest first.
+
+    Args:
+        path (str): Location of the timeline file.
+
+    Returns:
+        list[TimelineRecord]: The recorded checks in chronological order.
+
+    Raises:
+        ValueError: If the file is not a FortScript timeline or is
+            truncated.
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+
+    count = _parse_count(data[: _HEADER.size], None)
+    if count is None:
+        raise ValueError(f'{path} is not a FortScript timeline file.')
+    capacity = _HEADER.unpack_from(data)[3]
+    if len(data) < _HEADER.size + capacity * _RECORD.size:
+        raise ValueError(f'{path} is truncated.')
+
+    records = []
+    for index in range(max(0, count - capacity), count):
+        offset = _HEADER.size + (index % capacity) * _RECORD.size
+        timestamp, ram, sample_ms, action_ms, heavy, decision, running = (
+            _RECORD.unpack_from(data, offset)
+        )
+        records.append(
+            TimelineRecord(
+                timestamp=timestamp,
+                ram=None if math.isnan(ram) else round(ram, 2),
+                heavy=None if heavy == _UNKNOWN else bool(heavy),
+                decision=Decision(decision),
+                running=bool(running),
+                sample_ms=round(sample_ms, 3),
+                action_ms=round(action_ms, 3),
+            )
+        )
+    return records
+
+
+def _as_dict(record: TimelineRecord) -> dict:
+    row = record._asdict()
+    row['decision'] = record.decision.name.lower()
+    return row
+
+
+def export_csv(records: list[TimelineRecord], file: IO[str]) -> None:
+    """Writes timeline records as CSV with a header row."""
+    writer = csv.DictWriter(file, fieldnames=TimelineRecord._fields)
+    writer.writeheader()
+    for record in records:
+        writer.writerow(_as_dict(record))
+
+
+def export_json(records: list[TimelineRecord], file: IO[str]) -> None:
+    """Writes timeline records as a JSON array."""
+    json.dump([_as_dict(record) for record in records], file, indent=2)
@@ -0,0 +1,178 @@
+"""
+Rule engine that decides when scripts should be paused or resumed.
+
+Rules are small boolean expressions over monitor signals, for example::
+
+    heavy or ram > threshold or (cpu > 90 and load > 1.5)
+
+They are validated and compiled once, then evaluated on every check.
+"""
+
+import ast
+from enum import IntEnum
+from typing import Any
+
+from .monitors import Monitor
+
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.USub,
+    ast.UAdd,
+    ast.Compare,
+    ast.Gt,
+    ast.GtE,
+    ast.Lt,
+    ast.LtE,
+    ast.Eq,
+    ast.NotEq,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+)
+
+# Rules never need builtins, keep them out of reach of the expressions
+_EVAL_GLOBALS: dict[str, Any] = {'__builtins__': {}}
+
+
+class Decision(IntEnum):
+    """Outcome of a supervision step."""
+
+    HOLD = 0
+    PAUSE = 1
+    RESUME = 2
+
+
+class Rule:
+    """A boolean expression compiled once and evaluated against signals."""
+
+    def __init__(self, expression: str):
+        """
+        Parses, validates and compiles a rule expression.
+
+        Args:
+            expression (str): The rule, e.g. ``'heavy or ram > safe'``.
+
+        Raises:
+            ValueError: If the expression is invalid or uses unsupported
+                syntax (calls, attributes, subscripts, etc.).
+        """
+        self.expression = expression
+        try:
+            tree = ast.parse(expression, mode='eval')
+        except SyntaxError as e:
+            raise ValueError(f'Invalid rule {expression!r}: {e.msg}') from e
+
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED_NODES) or (
+                isinstance(node, ast.Constant)
+                and not isinstance(node.value, (int, float))
+            ):
+                raise ValueError(
+                    f'Unsupported syntax in rule {expression!r}: '
+                    f'{type(node).__name__}'
+                )
+
+        self.names = frozenset(
+            node.id for node in ast.walk(tree) if isinstance(node, ast.Name)
+        )
+        self._code = compile(tree, f'<rule {expression!r}>', 'eval')
+
+    def evaluate(self, signals: dict[str, float]) -> bool:
+        """Evaluates the rule with the given signal values."""
+        return bool(eval(self._code, _EVAL_GLOBALS, signals))
+
+    def __repr__(self) -> str:
+        return f'Rule({self.expression!r})'
+
+
+class RuleEngine:
+    """Samples the required monitors and evaluates pause/resume rules."""
+
+    def __init__(
+        self,
+        pause: str,
+        resume: str,
+        monitors: list[Monitor],
+        constants: dict[str, float] | None = None,
+    ):
+        """
+        Compiles the rules and selects the monitors they depend on.
+
+        Args:
+            pause (str): Expression that pauses running scripts when true.
+            resume (str): Expression that resumes paused scripts when true.
+            monitors (list[Monitor]): Available monitors. When several
+                monitors provide the same signal, the first one wins.
+            constants (dict[str, float], optional): Fixed names available
+                to the rules (e.g. ``threshold`` and ``safe``).
+
+        Raises:
+            ValueError: If a rule is invalid or references an unknown signal.
+        """
+        self.pause = Rule(pause)
+        self.resume = Rule(resume)
+        self.constants = dict(constants or {})
+
+        providers: dict[str, Monitor] = {}
+        for monitor in monitors:
+            for signal in monitor.signals:
+                providers.setdefault(signal, monitor)
+
+        needed = (self.pause.names | self.resume.names) - set(self.constants)
+        unknown = needed - set(providers)
+        if unknown:
+            raise ValueError(
+                f'Unknown signal(s) in rules: {", ".join(sorted(unknown))}'
+            )
+
+        # Only monitors referenced by a rule are ever sampled, and each
+        # signal is only taken from its provider
+        required = {id(providers[name]) for name in needed}
+        self.monitors = [m for m in monitors if id(m) in required]
+        self._provided = [
+            (m, tuple(s for s in m.signals if providers[s] is m))
+            for m in self.monitors
+        ]
+
+    @property
+    def signals(self) -> frozenset[str]:
+        """Names of the signals sampled on every check."""
+        return frozenset(s for _, names in self._provided for s in names)
+
+    def sample(self) -> dict[str, float]:
+        """Samples every required monitor and merges the signals."""
+        signals = dict(self.constants)
+        for monitor, names in self._provided:
+            values = monitor.sample()
+            for name in names:
+                if name in values:
+                    signals[name] = values[name]
+        return signals
+
+    def decide(self, signals: dict[str, float], running: bool) -> Decision:
+        """
+        Chooses the next action for the current signals.
+
+        Args:
+            signals (dict[str, float]): Values returned by :meth:`sample`.
+            running (bool): Whether the managed scripts are running.
+
+        Returns:
+            Decision: ``PAUSE`` or ``RESUME`` when a transition is due,
+            ``HOLD`` otherwise.
+        """
+        if running and self.pause.evaluate(signals):
+            return Decision.PAUSE
+        if not running and self.resume.evaluate(signals):
+            return Decision.RESUME
+        return Decision.HOLD
@@ -0,0 +1,220 @@
+"""
+Shared system sampler for running several FortScript groups in one process.
+
+Each group keeps its own projects, heavy processes and rules, but the
+process scan, the memory read and the system monitors (CPU, swap, load and
+disk) are sampled at most once per tick and shared by every group, so the
+sampling cost doesn't grow with the number of groups. Samples are only
+reused within :meth:`SystemSampler.tick`; a group checked on its own (its
+``tick``, ``start`` or ``run``) always reads fresh ones.
+"""
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Any
+
+import psutil
+
+from .monitors import Monitor, default_monitors
+from .procscan import (
+    ProcessSample,
+    create_scanner,
+    process_names,
+    process_table,
+)
+
+if TYPE_CHECKING:
+    from .main import FortScript
+    from .rules import Decision
+
+logger = logging.getLogger(__name__)
+
+
+class _SharedMonitor(Monitor):
+    """A system monitor sampled at most once per tick for every group."""
+
+    def __init__(self, sampler: 'SystemSampler', monitor: Monitor):
+        self.signals = monitor.signals
+        self._sampler = sampler
+        self._monitor = monitor
+
+    def sample(self) -> dict[str, float]:
+        return self._sampler.sample_monitor(self._monitor)
+
+
+class SystemSampler:
+    """Samples the system once per tick for any number of groups."""
+
+    def __init__(self, interval: float = 5.0, process_backend: str = 'psutil'):
+        """
+        Args:
+            interval (float): Seconds between ticks in :meth:`run` and
+                :meth:`start`.
+            process_backend (str): Process listing backend, ``'psutil'``,
+                ``'proc'`` or ``'auto'``.
+        """
+        self.interval = interval
+        self.groups: list['FortScript'] = []
+        self._scanner = create_scanner(process_backend)
+        self._process_names: list[str] | None = None
+        self._processes: list[ProcessSample] | None = None
+        self._virtual_memory: Any = None
+        self._monitors = default_monitors()
+        self._signals: dict[Monitor, dict[str, float]] = {}
+        self._ticking = False
+
+        self._thread: threading.Thread | None = None
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._stopped = threading.Event()
+
+    def add(self, group: 'FortScript') -> None:
+        """Registers a group. Done automatically by ``FortScript``."""
+        if group not in self.groups:
+            self.groups.append(group)
+
+    def is_managed(self, pid: int) -> bool:
+        """Returns True if a process belongs to a project of any group."""
+        return any(group.is_project_process(pid) for group in self.groups)
+
+    def process_names(self) -> list[str]:
+        """Returns the unique lowercase process names for this tick."""
+        self._expire()
+        if self._process_names is None:
+            if self._processes is not None:
+                names = [proc.name.lower() for proc in self._processes]
+            else:
+                names = process_names(self._scanner)
+            self._process_names = list(set(names))
+        return self._process_names
+
+    def processes(self) -> list[ProcessSample]:
+        """Returns the name and resource usage of every process this tick."""
+        self._expire()
+        if self._processes is None:
+            self._processes = process_table(self._scanner)
+        return self._processes
+
+    def virtual_memory(self) -> Any:
+        """Returns ``psutil.virtual_memory()`` for this tick."""
+        self._expire()
+        if self._virtual_memory is None:
+            self._virtual_memory = psutil.virtual_memory()
+        return self._virtual_memory
+
+    def system_monitors(self) -> list[Monitor]:
+        """
+        Returns the built-in system monitors (CPU, swap, load and disk)
+        shared by every group, so each is sampled once per tick.
+        """
+        return [_SharedMonitor(self, monitor) for monitor in self._monitors]
+
+    def sample_monitor(self, monitor: Monitor) -> dict[str, float]:
+        """Returns the signals of a shared system monitor for this tick."""
+        self._expire()
+        if monitor not in self._signals:
+            self._signals[monitor] = monitor.sample()
+        return self._signals[monitor]
+
+    def advance(self) -> None:
+        """Starts a new tick, discarding the cached samples."""
+        self._process_names = None
+        self._processes = None
+        self._virtual_memory = None
+        self._signals.clear()
+
+    def _expire(self) -> None:
+        """Discards the samples when called outside :meth:`tick`."""
+        if not self._ticking:
+            self.advance()
+
+    def tick(self) -> list['Decision']:
+        """
+        Runs one supervision step for every group.
+
+        Samples are taken lazily, only if a group's rules need them.
+
+        Returns:
+            list[Decision]: The decision of each group, in order.
+        """
+        self.advance()
+        self._ticking = True
+        try:
+            return [group.tick() for group in self.groups]
+        finally:
+            self._ticking = False
+            self.advance()
+
+    def _supervise(self) -> None:
+        """Runs ticks until stopped, then marks the sampler stopped."""
+        try:
+            while not self._stopping.is_set():
+                # Cleared before the tick, so a poke during it isn't lost
+                self._wake.clear()
+                self.tick()
+                self._wake.wait(self.interval)
+        finally:
+            if self._thread is threading.current_thread():
+                self._thread = None
+            self._stopped.set()
+
+    def start(self) -> None:
+        """
+        Runs every registered group on a background thread and returns
+        immediately.
+
+        Does nothing if the sampler is already running.
+        """
+        if self._thread is not None:
+            return
+        for group in self.groups:
+            group.open()
+        self._stopping.clear()
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._supervise,
+            name='fortscript-sampler',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops ticking and stops every group (see ``FortScript.stop``).
+
+        Waits for a tick in progress to finish, but not for the interval
+        between ticks.
+        """
+        self._stopping.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            self._stopped.wait()
+        for group in self.groups:
+            group.stop()
+
+    def poke(self) -> None:
+        """Runs the next tick right away instead of after the interval."""
+        self._wake.set()
+
+    def run(self) -> None:
+        """
+        Runs every registered group, blocking until :meth:`stop` is called
+        from another thread or the process is interrupted.
+
+        Raises:
+            RuntimeError: If the sampler is already running.
+        """
+        if self._thread is not None:
+            raise RuntimeError('The sampler is already running')
+        for group in self.groups:
+            group.open()
+        self._stopping.clear()
+        self._stopped.clear()
+        self._thread = threading.current_thread()
+        try:
+            self._supervise()
+        except KeyboardInterrupt:
+            logger.info('Interrupted, stopping projects...')
+            self.stop()
+            raise
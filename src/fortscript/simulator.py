@@ -0,0 +1,383 @@
+"""
+Offline policy simulator.
+
+Replays a trace of RAM and heavy-process samples through the same rule
+engine and admission controller used by :meth:`FortScript.tick`, with a
+virtual clock and fake projects instead of real processes.
+
+:func:`sweep` compiles the rules once for every combination, and the
+default rules are replayed with plain comparisons instead of ``eval``. On
+a typical desktop, this replays about 3 million samples per second with
+the default rules (the 1025 ``threshold``/``safe`` combinations of a 6 hour
+trace at the 5 second interval in about 1.5 seconds), and about 1 million
+per second with custom rules or staggered project admission.
+
+Only the ``ram`` and ``heavy`` signals are replayed. Projects exiting on
+their own, checkpoints and the page-out pause mode are not modelled.
+"""
+
+import itertools
+import random
+from dataclasses import dataclass, field
+from typing import Any, Iterable, NamedTuple
+
+from .admission import AdmissionController
+from .main import AdmissionConfig, RamConfig, RuleConfig
+from .monitors import Monitor
+from .recorder import TimelineRecord
+from .rules import Decision, RuleEngine
+
+
+class TraceSample(NamedTuple):
+    """A single point of a trace."""
+
+    timestamp: float
+    ram: float
+    heavy: bool
+
+
+class SimulationResult(NamedTuple):
+    """Summary of a simulated run."""
+
+    threshold: int
+    safe: int
+    pauses: int
+    resumes: int
+    paused_time: float
+    flaps: int
+
+
+class _TraceMonitor(Monitor):
+    """Declares the signals available in a trace."""
+
+    signals = ('ram', 'heavy')
+
+    def sample(self) -> dict[str, float]:
+        return {'ram': 0.0, 'heavy': False}
+
+
+@dataclass
+class ProjectModel:
+    """
+    How the simulated projects use RAM.
+
+    With admission enabled (the FortScript default), resumes are staggered
+    exactly like :meth:`FortScript.tick` does, starting from unknown
+    project costs.
+    """
+
+    ram: list[float] = field(default_factory=list)
+    admission: AdmissionConfig = field(default_factory=AdmissionConfig)
+
+
+@dataclass
+class TraceProfile:
+    """Shape of a synthetic trace."""
+
+    duration: float = 6 * 3600
+    interval: float = 5.0
+    base_ram: float = 60.0
+    noise: float = 2.0
+    sessions: int = 4
+    session_ram: float = 25.0
+
+
+class FakeProjects:
+    """Stands in for the managed projects during a simulation."""
+
+    def __init__(self, model: ProjectModel, safe: float):
+        """
+        Args:
+            model (ProjectModel): RAM (%) added by each project once
+                started, and the admission settings.
+            safe (float): ``RamConfig.safe``. Admitted projects are kept
+                ``margin`` points below it.
+        """
+        self.model = model
+        self.projects = [
+            {'name': f'project-{index}', 'ram': ram}
+            for index, ram in enumerate(model.ram)
+        ]
+        self.admission = AdmissionController(
+            ceiling=safe - model.admission.margin,
+            smoothing=model.admission.smoothing,
+            unknown_cost=model.admission.unknown_cost,
+        )
+        self.running: list[dict[str, Any]] = []
+        #: RAM (%) currently used by the fake projects.
+        self.ram = 0.0
+
+    def resume(self, ram: float) -> None:
+        """Starts the projects, staggered if admission is enabled."""
+        if self.model.admission.enabled:
+            self.admission.begin(self.projects)
+            self.admit(ram)
+        else:
+            self.running = list(self.projects)
+            self.ram = sum(project['ram'] for project in self.running)
+
+    def admit(self, ram: float) -> None:
+        """Starts the pending projects that fit in the RAM headroom."""
+        admitted = self.admission.admit(ram)
+        self.running.extend(admitted)
+        self.ram += sum(project['ram'] for project in admitted)
+
+    def stop(self) -> None:
+        self.running = []
+        self.ram = 0.0
+        self.admission.cancel()
+
+    @property
+    def pending(self) -> bool:
+        """True while admitted projects are still waiting to start."""
+        return bool(self.admission.pending)
+
+
+def _ran_during_sample(record: TimelineRecord) -> bool:
+    """
+    Returns whether the projects were running when a check sampled RAM.
+
+    ``running`` is the state after the check's decision, but RAM is sampled
+    before it: projects were running before a pause and stopped before a
+    resume.
+    """
+    if record.decision == Decision.PAUSE:
+        return True
+    if record.decision == Decision.RESUME:
+        return False
+    return record.running
+
+
+def from_timeline(
+    records: Iterable[TimelineRecord], project_ram: float = 0.0
+) -> list[TraceSample]:
+    """
+    Converts recorded timeline checks into a trace.
+
+    Args:
+        records (Iterable[TimelineRecord]): Records from
+            :func:`fortscript.recorder.read_timeline`.
+        project_ram (float): RAM (%) used by the projects, subtracted from
+            samples taken while they were running so the trace reflects the
+            rest of the system.
+
+    Returns:
+        list[TraceSample]: Samples that have a RAM reading.
+    """
+    return [
+        TraceSample(
+            r.timestamp,
+            max(0.0, r.ram - (project_ram if _ran_during_sample(r) else 0.0)),
+            bool(r.heavy),
+        )
+        for r in records
+        if r.ram is not None
+    ]
+
+
+def synthetic_trace(
+    profile: TraceProfile | None = None, seed: int | None = None
+) -> list[TraceSample]:
+    """
+    Generates a trace with background noise and heavy gaming sessions.
+
+    Args:
+        profile (TraceProfile, optional): Trace length, interval, average
+            RAM (%), amplitude of the random walk around it, and the
+            number and RAM (%) of heavy sessions.
+        seed (int, optional): Seed for reproducible traces.
+
+    Returns:
+        list[TraceSample]: The generated samples.
+    """
+    profile = profile or TraceProfile()
+    interval, noise = profile.interval, profile.noise
+    sessions = profile.sessions
+    rng = random.Random(seed)
+    steps = int(profile.duration / interval)
+
+    active = [False] * steps
+    for _ in range(sessions if steps else 0):
+        start = rng.randrange(steps)
+        length = rng.randrange(steps // (sessions * 4) + 1) + 1
+        for step in range(start, min(steps, start + length)):
+            active[step] = True
+
+    trace = []
+    offset = 0.0
+    for step in range(steps):
+        offset += rng.gauss(0, noise)
+        offset = max(-4 * noise, min(4 * noise, offset))
+        ram = (
+            profile.base_ram
+            + offset
+            + (profile.session_ram if active[step] else 0.0)
+        )
+        trace.append(
+            TraceSample(
+                step * interval, min(100.0, max(0.0, ram)), active[step]
+            )
+        )
+    return trace
+
+
+def _compile(rules: RuleConfig) -> RuleEngine | None:
+    """
+    Compiles the rules for a trace, or returns None for the default rules,
+    which are replayed with plain comparisons instead of ``eval``.
+
+    Raises:
+        ValueError: If a rule is invalid or uses a signal missing from
+            traces.
+    """
+    if rules == RuleConfig():
+        return None
+    return RuleEngine(
+        pause=rules.pause,
+        resume=rules.resume,
+        monitors=[_TraceMonitor()],
+        constants={'threshold': 0, 'safe': 0},
+    )
+
+
+def simulate(
+    trace: list[TraceSample],
+    ram_config: RamConfig | None = None,
+    rules: RuleConfig | None = None,
+    projects: ProjectModel | None = None,
+    flap_window: float = 60.0,
+) -> SimulationResult:
+    """
+    Replays a trace through the pause/resume decision logic.
+
+    Args:
+        trace (list[TraceSample]): Samples in chronological order.
+        ram_config (RamConfig, optional): RAM limits to evaluate.
+        rules (RuleConfig, optional): Rules to evaluate. Only the ``ram``
+            and ``heavy`` signals are available in a trace.
+        projects (ProjectModel, optional): RAM (%) used by each project
+            once started, and how resumes are admitted.
+        flap_window (float): A pause happening less than this many seconds
+            after a resume is counted as a flap.
+
+    Returns:
+        SimulationResult: Pause/resume counts, time spent with the
+        projects stopped (including the initial wait) and flaps.
+    """
+    return _replay(
+        trace,
+        ram_config or RamConfig(),
+        _compile(rules or RuleConfig()),
+        projects or ProjectModel(),
+        flap_window,
+    )
+
+
+def _replay(
+    trace: list[TraceSample],
+    ram_config: RamConfig,
+    engine: RuleEngine | None,
+    projects: ProjectModel,
+    flap_window: float,
+) -> SimulationResult:
+    """Runs :func:`simulate` with rules compiled by :func:`_compile`."""
+    safe = ram_config.safe
+    fake = FakeProjects(projects, safe)
+    signals = {
+        'threshold': ram_config.threshold,
+        'safe': safe,
+        'ram': 0.0,
+        'heavy': False,
+    }
+
+    # Locals keep the per-sample loop cheap
+    pause, resume, hold = Decision.PAUSE, Decision.RESUME, Decision.HOLD
+    admission = fake.admission
+
+    running = admitting = False
+    pauses = resumes = flaps = 0
+    paused_time = 0.0
+    previous = trace[0].timestamp if trace else 0.0
+    resumed_at: float | None = None
+
+    for now, sample_ram, heavy in trace:
+        if not running:
+            paused_time += now - previous
+        previous = now
+        ram = sample_ram + fake.ram
+
+        if engine is not None:
+            signals['ram'] = ram
+            signals['heavy'] = heavy
+            decision = engine.decide(signals, running)
+        elif running:
+            decision = pause if heavy or ram > safe else hold
+        else:
+            decision = resume if not heavy and ram < safe else hold
+
+        if decision == pause:
+            fake.stop()
+            running = admitting = False
+            pauses += 1
+            if resumed_at is not None and now - resumed_at < flap_window:
+                flaps += 1
+        elif decision == resume:
+            fake.resume(ram)
+            running = admitting = True
+            resumes += 1
+            resumed_at = now
+        elif admitting:
+            # Mirrors the staggered resume and settle steps of tick()
+            if admission.pending:
+                fake.admit(ram)
+            elif admission.settling:
+                admission.settle(ram)
+            else:
+                admitting = False
+
+    return SimulationResult(
+        threshold=ram_config.threshold,
+        safe=safe,
+        pauses=pauses,
+        resumes=resumes,
+        paused_time=paused_time,
+        flaps=flaps,
+    )
+
+
+def sweep(
+    trace: list[TraceSample],
+    thresholds: Iterable[int],
+    safes: Iterable[int],
+    **options: Any,
+) -> list[SimulationResult]:
+    """
+    Simulates every valid ``threshold``/``safe`` combination.
+
+    Combinations where ``safe`` is not below ``threshold`` are skipped.
+
+    Args:
+        trace (list[TraceSample]): Samples in chronological order.
+        thresholds (Iterable[int]): ``threshold`` values to evaluate.
+        safes (Iterable[int]): ``safe`` values to evaluate.
+        **options: ``rules``, ``projects`` and ``flap_window``, passed to
+            :func:`simulate`.
+
+    Returns:
+        list[SimulationResult]: One result per combination.
+    """
+    # The rules are compiled once for every combination
+    engine = _compile(options.get('rules') or RuleConfig())
+    projects = options.get('projects') or ProjectModel()
+    flap_window = options.get('flap_window', 60.0)
+    return [
+        _replay(
+            trace,
+            RamConfig(threshold=threshold, safe=safe),
+            engine,
+            projects,
+            flap_window,
+        )
+        for threshold, safe in itertools.product(thresholds, list(safes))
+        if safe < threshold
+    ]
@@ -0,0 +1,190 @@
+"""
+Project launcher with cached command resolution.
+
+Resolving how to start a project (interpreter lookup in ``.venv``, ``npm``
+location, working directory and environment) happens once per project and is
+cached until :meth:`Spawner.invalidate` is called. Where supported, projects
+that don't need a working directory change are launched with
+``os.posix_spawn``, which skips ``subprocess.Popen``'s generic fork/exec path.
+"""
+
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Mapping, Protocol
+
+# Signals that Python ignores at startup and that must not stay ignored in
+# the launched program (same as ``Popen(restore_signals=True)``)
+_RESTORED_SIGNALS = tuple(
+    getattr(signal, name)
+    for name in ('SIGPIPE', 'SIGXFZ', 'SIGXFSZ')
+    if hasattr(signal, name)
+)
+
+
+# Exit code reported for a child that was reaped by someone else, so its
+# real status can't be known (outside the range of real exit codes)
+EXIT_UNKNOWN = -(1 << 16)
+
+
+class ProcessHandle(Protocol):
+    """The subset of ``subprocess.Popen`` used to track projects."""
+
+    pid: int
+
+    def poll(self) -> int | None: ...
+
+
+@dataclass(frozen=True)
+class LaunchSpec:
+    """Everything needed to start a project, resolved once."""
+
+    name: str
+    argv: tuple[str, ...]
+    cwd: str | None
+    env: Mapping[str, str]
+
+
+class SpawnedProcess:
+    """Minimal ``Popen``-like handle for processes started by posix_spawn."""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.returncode: int | None = None
+
+    def poll(self) -> int | None:
+        """Returns the exit code, or None if the process is still running."""
+        if self.returncode is None:
+            try:
+                pid, status = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                # Already reaped elsewhere (e.g. psutil.wait_procs)
+                self.returncode = EXIT_UNKNOWN
+            else:
+                if pid:
+                    self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+
+class Spawner:
+    """Resolves and launches projects, recording spawn latency."""
+
+    def __init__(self, new_console: bool = True):
+        """
+        Args:
+            new_console (bool): If True, launches scripts in a separate
+                console (Windows only).
+        """
+        self.is_windows = os.name == 'nt'
+        self.creation_flags = (
+            subprocess.CREATE_NEW_CONSOLE
+            if self.is_windows and new_console
+            else 0
+        )
+        # Each project gets its own process group (Windows) or session
+        # (POSIX), so its whole tree can be signalled at once
+        if self.is_windows:
+            self.creation_flags |= subprocess.CREATE_NEW_PROCESS_GROUP
+        self.use_posix_spawn = hasattr(os, 'posix_spawn')
+        self.latency: dict[str, float] = {}
+        self._cache: dict[tuple[str, str], LaunchSpec | None] = {}
+
+    def invalidate(self) -> None:
+        """Forgets every resolved project (e.g. after a config reload)."""
+        self._cache.clear()
+
+    def resolve(self, name: str, script_path: str) -> LaunchSpec | None:
+        """
+        Returns how to launch a project, resolving it on first use.
+
+        Args:
+            name (str): The project name.
+            script_path (str): The project's ``path`` setting.
+
+        Returns:
+            LaunchSpec | None: The launch details, or None if the project
+            type is not supported.
+        """
+        key = (name, script_path)
+        if key not in self._cache:
+            self._cache[key] = self._resolve(name, script_path)
+        return self._cache[key]
+
+    def _resolve(self, name: str, script_path: str) -> LaunchSpec | None:
+        project_dir = os.path.dirname(script_path)
+        env = dict(os.environ)
+
+        # Check if the script is Python
+        if script_path.endswith('.py'):
+            if self.is_windows:
+                venv_python = os.path.join(
+                    project_dir, '.venv', 'Scripts', 'python.exe'
+                )
+            else:
+                venv_python = os.path.join(
+                    project_dir, '.venv', 'bin', 'python'
+                )
+
+            python_exe = (
+                venv_python if os.path.exists(venv_python) else sys.executable
+            )
+            return LaunchSpec(name, (python_exe, script_path), None, env)
+
+        if script_path.endswith('package.json'):
+            npm = 'npm.cmd' if self.is_windows else 'npm'
+            return LaunchSpec(
+                name,
+                (shutil.which(npm) or npm, 'run', 'start'),
+                project_dir,
+                env,
+            )
+
+        if script_path.endswith('.exe') and self.is_windows:
+            return LaunchSpec(
+                name, ('cmd.exe', '/c', str(script_path)), project_dir, env
+            )
+
+        return None
+
+    def spawn(
+        self, spec: LaunchSpec, extra_env: Mapping[str, str] | None = None
+    ) -> ProcessHandle:
+        """
+        Launches a resolved project.
+
+        Args:
+            spec (LaunchSpec): The project launch details.
+            extra_env (Mapping[str, str], optional): Variables added to the
+                cached environment for this launch only.
+
+        Returns:
+            ProcessHandle: A handle to the started process.
+        """
+        env = {**spec.env, **extra_env} if extra_env else spec.env
+        started = time.perf_counter()
+
+        # posix_spawn can't change the working directory of the child
+        if self.use_posix_spawn and spec.cwd is None:
+            pid = os.posix_spawn(
+                spec.argv[0],
+                spec.argv,
+                env,
+                setsigdef=_RESTORED_SIGNALS,
+                setsid=True,
+            )
+            proc: ProcessHandle = SpawnedProcess(pid)
+        else:
+            proc = subprocess.Popen(
+                spec.argv,
+                cwd=spec.cwd,
+                env=env,
+                creationflags=self.creation_flags,
+                start_new_session=not self.is_windows,
+            )
+
+        self.latency[spec.name] = (time.perf_counter() - started) * 1000
+        return proc
@@ -0,0 +1,292 @@
+"""
+Process tree tracking for managed projects.
+
+Each project is launched in its own session (POSIX) or process group
+(Windows). On Linux, when FortScript's cgroup v2 subtree is delegated to it,
+the project is also moved into a dedicated child cgroup. This gives three
+tracking levels, from most to least precise:
+
+- ``cgroup``: membership is read from ``cgroup.procs`` and includes
+  descendants that were reparented to init or started a new session.
+- ``session``: signals go to the whole process group with ``killpg``, which
+  still reaches reparented grandchildren.
+- ``walk``: the original ``psutil`` descendant walk, used on Windows.
+"""
+
+import logging
+import os
+import signal
+import time
+
+import psutil
+
+from .spawn import ProcessHandle
+
+logger = logging.getLogger(__name__)
+
+_CGROUP_PREFIX = 'fortscript-'
+
+
+def _cgroup2_mount() -> str | None:
+    """Returns the cgroup v2 mount point, if any."""
+    try:
+        with open('/proc/self/mountinfo') as mountinfo:
+            for line in mountinfo:
+                fields, _, fs = line.partition(' - ')
+                if fs.split(' ', 1)[0] == 'cgroup2':
+                    return fields.split(' ')[4]
+    except OSError:
+        pass
+    return None
+
+
+def delegated_cgroup() -> str | None:
+    """
+    Returns FortScript's own cgroup v2 directory if child cgroups can be
+    created in it and processes moved into them.
+    """
+    mount = _cgroup2_mount()
+    if mount is None:
+        return None
+    try:
+        with open('/proc/self/cgroup') as cgroups:
+            path = next(
+                line[3:].strip() for line in cgroups if line.startswith('0::')
+            )
+        base = os.path.join(mount, path.lstrip('/'))
+        with open(os.path.join(base, 'cgroup.subtree_control')) as control:
+            # Processes can't live in children of a cgroup that distributes
+            # domain controllers while FortScript itself lives in it
+            if control.read().strip() and path != '/':
+                return None
+    except (OSError, StopIteration):
+        return None
+
+    if os.access(base, os.W_OK) and os.access(
+        os.path.join(base, 'cgroup.procs'), os.W_OK
+    ):
+        return base
+    return None
+
+
+def _is_running(p: psutil.Process) -> bool:
+    try:
+        return p.is_running() and p.status() != psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return False
+
+
+class ProjectTree:
+    """All the processes started by one project."""
+
+    def __init__(
+        self, proc: ProcessHandle, name: str, cgroup: str | None = None
+    ):
+        """
+        Args:
+            proc (ProcessHandle): Handle of the launched project process.
+            name (str): The project name.
+            cgroup (str, optional): Dedicated cgroup directory of the
+                project, if it could be created.
+        """
+        self.proc = proc
+        self.name = name
+        self.cgroup = cgroup
+        self.session = os.name != 'nt'
+        self._snapshot: list[psutil.Process] = []
+
+    @property
+    def mode(self) -> str:
+        """Tracking level: ``'cgroup'``, ``'session'`` or ``'walk'``."""
+        if self.cgroup is not None:
+            return 'cgroup'
+        return 'session' if self.session else 'walk'
+
+    def pids(self) -> list[int]:
+        """Returns the PIDs of the tree."""
+        if self.cgroup is not None:
+            try:
+                with open(os.path.join(self.cgroup, 'cgroup.procs')) as procs:
+                    return [int(pid) for pid in procs.read().split()]
+            except OSError:
+                return []
+        return [p.pid for p in self._walk()]
+
+    def members(self) -> list[psutil.Process]:
+        """Returns the processes of the tree."""
+        if self.cgroup is None:
+            return self._walk()
+        members = []
+        for pid in self.pids():
+            try:
+                members.append(psutil.Process(pid))
+            except psutil.NoSuchProcess:
+                pass
+        return members
+
+    def contains(self, pid: int) -> bool:
+        """Returns True if a process belongs to the tree."""
+        if self.mode == 'session':
+            try:
+                return os.getsid(pid) == self.proc.pid
+            except (ProcessLookupError, PermissionError):
+                return False
+        return pid in self.pids()
+
+    def _walk(self) -> list[psutil.Process]:
+        try:
+            parent_process = psutil.Process(self.proc.pid)
+            return [parent_process, *parent_process.children(recursive=True)]
+        except psutil.NoSuchProcess:
+            return []
+
+    def send_signal(self, sig: int) -> None:
+        """Sends a signal to every process of the tree."""
+        if self.mode == 'walk':
+            for p in self._walk():
+                try:
+                    p.send_signal(sig)
+                except psutil.NoSuchProcess:
+                    pass
+            return
+
+        # Children forked before the move to the cgroup are only reachable
+        # through the session
+        if self.cgroup is not None:
+            for pid in self.pids():
+                try:
+                    os.kill(pid, sig)
+                except ProcessLookupError:
+                    pass
+        try:
+            os.killpg(self.proc.pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def terminate(self) -> None:
+        """Asks every process of the tree to exit."""
+        if self.mode == 'walk':
+            # Remember the tree, children can't be found once the parent
+            # exits
+            self._snapshot = self._walk()
+            for p in self._snapshot:
+                try:
+                    p.terminate()
+                except psutil.NoSuchProcess:
+                    pass
+        else:
+            self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        """Forcefully kills every process of the tree."""
+        if self.mode == 'walk':
+            for p in self._snapshot or self._walk():
+                try:
+                    p.kill()
+                except psutil.NoSuchProcess:
+                    pass
+            return
+
+        if self.cgroup is not None:
+            try:
+                with open(os.path.join(self.cgroup, 'cgroup.kill'), 'w') as f:
+                    f.write('1')
+            except OSError:
+                pass  # cgroup.kill needs Linux 5.14
+        # Also reaches children that only share the session
+        self.send_signal(signal.SIGKILL)
+
+    def is_alive(self) -> bool:
+        """Returns True while any process of the tree is running."""
+        self.proc.poll()  # Reap the project process if it exited
+        if self.mode == 'walk':
+            return any(_is_running(p) for p in self._snapshot or self._walk())
+        if self.cgroup is not None and self.pids():
+            return True
+        try:
+            os.killpg(self.proc.pid, 0)
+            return True
+        except (ProcessLookupError, PermissionError):
+            return False
+
+    def rss(self) -> int:
+        """Returns the memory used by the tree in bytes."""
+        if self.cgroup is not None:
+            try:
+                with open(os.path.join(self.cgroup, 'memory.current')) as f:
+                    return int(f.read())
+            except (OSError, ValueError):
+                pass  # Memory controller not enabled, sum the members
+        total = 0
+        for p in self.members():
+            try:
+                total += p.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        return total
+
+    def release(self) -> None:
+        """Removes the project cgroup once the tree has exited."""
+        if self.cgroup is not None:
+            try:
+                os.rmdir(self.cgroup)
+            except OSError as e:
+                logger.debug(f'Could not remove {self.cgroup}: {e}')
+
+
+class TreeTracker:
+    """Creates :class:`ProjectTree` handles for launched projects."""
+
+    def __init__(self, use_cgroup: bool = True):
+        """
+        Args:
+            use_cgroup (bool): If True, a dedicated cgroup v2 is created for
+                each project when FortScript's subtree is delegated.
+        """
+        self.cgroup_root = delegated_cgroup() if use_cgroup else None
+
+    def track(self, proc: ProcessHandle, name: str) -> ProjectTree:
+        """
+        Starts tracking a freshly launched project.
+
+        Args:
+            proc (ProcessHandle): Handle of the launched process.
+            name (str): The project name.
+
+        Returns:
+            ProjectTree: The project tree.
+        """
+        return ProjectTree(proc, name, self._create_cgroup(proc.pid))
+
+    def _create_cgroup(self, pid: int) -> str | None:
+        if self.cgroup_root is None:
+            return None
+
+        path = os.path.join(self.cgroup_root, f'{_CGROUP_PREFIX}{pid}')
+        try:
+            os.mkdir(path)
+            with open(os.path.join(path, 'cgroup.procs'), 'w') as procs:
+                procs.write(str(pid))
+        except OSError as e:
+            logger.debug(f'cgroup tracking unavailable ({e}).')
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
+            return None
+        return path
+
+
+def wait_trees(trees: list[ProjectTree], timeout: float) -> list[ProjectTree]:
+    """
+    Waits until every tree exits or the timeout expires.
+
+    Returns:
+        list[ProjectTree]: The trees that are still alive.
+    """
+    deadline = time.monotonic() + timeout
+    alive = [tree for tree in trees if tree.is_alive()]
+    while alive and time.monotonic() < deadline:
+        time.sleep(0.05)
+        alive = [tree for tree in alive if tree.is_alive()]
+    return alive
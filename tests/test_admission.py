@@ -0,0 +1,127 @@
+"""Tests for the staggered resume admission controller."""
+
+import pytest
+
+from fortscript import AdmissionConfig, FortScript, RamConfig
+from fortscript.admission import AdmissionController
+
+
+def _names(projects):
+    return [p['name'] for p in projects]
+
+
+def test_projects_are_admitted_in_priority_order():
+    controller = AdmissionController(ceiling=80)
+    controller.begin([
+        {'name': 'a'},
+        {'name': 'b', 'priority': 5},
+        {'name': 'c'},
+    ])
+    # Unknown costs: one project per step
+    assert _names(controller.admit(40)) == ['b']
+    assert _names(controller.admit(50)) == ['a']
+    assert _names(controller.admit(60)) == ['c']
+    assert controller.costs == {'b': 10, 'a': 10}
+
+
+def test_learned_costs_allow_batches_within_headroom():
+    controller = AdmissionController(ceiling=80)
+    controller.costs = {'a': 10, 'b': 10, 'c': 10}
+    controller.begin([{'name': 'a'}, {'name': 'b'}, {'name': 'c'}])
+
+    assert _names(controller.admit(55)) == ['a', 'b']
+    # RAM grew more than expected, c waits until memory frees up
+    assert controller.admit(76) == []
+    # Half of the 1 point overshoot is blended into each cost
+    assert controller.costs['a'] == controller.costs['b'] == 10 + 0.5 / 2
+    assert _names(controller.admit(60)) == ['c']
+
+
+def test_cancel_drops_pending_projects():
+    controller = AdmissionController(ceiling=80)
+    controller.begin([{'name': 'a'}, {'name': 'b'}])
+    controller.admit(10)
+    controller.cancel()
+    assert controller.pending == []
+    assert controller.admit(10) == []
+
+
+def test_unknown_cost_estimate_batches_first_resume():
+    controller = AdmissionController(ceiling=80, unknown_cost=10)
+    controller.begin([{'name': n} for n in 'abcde'])
+
+    # 50 + a + b stays under 80, c would reach it
+    assert _names(controller.admit(50)) == ['a', 'b']
+    assert _names(controller.admit(56)) == ['c', 'd']
+    assert controller.costs == {'a': 3, 'b': 3}
+
+
+def test_last_batch_is_measured_once_nothing_is_pending():
+    controller = AdmissionController(ceiling=90, unknown_cost=10)
+    controller.begin([{'name': n} for n in 'abc'])
+
+    assert _names(controller.admit(50)) == ['a', 'b', 'c']
+    assert not controller.pending
+    assert controller.settling
+
+    controller.settle(59)
+    assert controller.costs == {'a': 3, 'b': 3, 'c': 3}
+    assert not controller.settling
+
+
+def test_fortscript_learns_costs_when_every_project_fits(monkeypatch):
+    app = FortScript(
+        config_path='nonexistent.yaml',
+        projects=[{'name': n, 'path': f'{n}.py'} for n in 'abc'],
+        admission=AdmissionConfig(unknown_cost=5),
+    )
+    monkeypatch.setattr(app, '_start_project', lambda p: None)
+    ram = iter([50.0, 59.0])
+    constants = app.rule_engine.constants
+    monkeypatch.setattr(
+        app.rule_engine,
+        'sample',
+        lambda: {**constants, 'ram': next(ram), 'heavy': False},
+    )
+
+    app.tick()
+    assert not app.admission.pending
+    app.tick()
+    assert app.admission.costs == {'a': 3, 'b': 3, 'c': 3}
+
+
+def test_fortscript_resume_goes_through_admission(monkeypatch):
+    app = FortScript(
+        config_path='nonexistent.yaml',
+        projects=[{'name': n, 'path': f'{n}.py'} for n in 'abc'],
+        ram_config=RamConfig(threshold=95, safe=85),
+        admission=AdmissionConfig(margin=5, unknown_cost=10),
+    )
+    started = []
+    monkeypatch.setattr(
+        app, '_start_project', lambda p: started.append(p['name'])
+    )
+    app._handle_start_condition({'ram': 50.0})
+    assert started == ['a', 'b']
+    assert _names(app.admission.pending) == ['c']
+    assert app.admission.ceiling == RamConfig().safe - 5
+
+
+def _from_yaml(tmp_path, text):
+    path = tmp_path / 'fortscript.yaml'
+    path.write_text(text)
+    return FortScript(config_path=str(path))
+
+
+def test_admission_yaml_section(tmp_path):
+    assert not _from_yaml(
+        tmp_path, 'admission: false'
+    ).admission_config.enabled
+
+    app = _from_yaml(tmp_path, 'admission:\n  margin: 4\n')
+    assert app.admission_config == AdmissionConfig(margin=4)
+
+    with pytest.raises(ValueError, match='marign'):
+        _from_yaml(tmp_path, 'admission:\n  marign: 4\n')
+    with pytest.raises(ValueError, match='mapping'):
+        _from_yaml(tmp_path, 'admission: fast')
@@ -1,6 +1,8 @@
 """Basic tests for FortScript."""
 
-from fortscript import FortScript
+import pytest
+
+from fortscript import FortScript, RuleConfig
 
 
 def test_import():
@@ -15,3 +17,14 @@ def test_instantiation_without_config():
     assert app.active_processes == []
     assert app.projects == []
     assert app.heavy_processes == []
+
+
+def test_original_positional_arguments_keep_their_order():
+    """Test that newer settings don't shift the original arguments."""
+    app = FortScript('nonexistent.yaml', [], [], None, None, 'INFO', False)
+    assert app.new_console is False
+    assert app.rule_config == RuleConfig()
+    with pytest.raises(TypeError):
+        FortScript(
+            'nonexistent.yaml', [], [], None, None, 'INFO', False, RuleConfig()
+        )
@@ -0,0 +1,144 @@
+"""Tests for the warm-resume checkpoint protocol."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import fortscript
+from fortscript import FortScript
+from fortscript.checkpoint import CheckpointClient, CheckpointServer
+
+PROJECT = """
+import pathlib, sys, time
+from fortscript import checkpoint
+
+out = pathlib.Path(sys.argv[0]).with_name('events.txt')
+with out.open('a') as f:
+    f.write(f'start resumed={checkpoint.resumed()}\\n')
+
+def save():
+    with out.open('a') as f:
+        f.write('checkpoint\\n')
+
+checkpoint.on_checkpoint(save)
+time.sleep(60)
+"""
+
+
+def _wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return condition()
+
+
+def test_server_collects_acknowledgements(monkeypatch):
+    server = CheckpointServer()
+    for key, value in server.env('bot', resumed=False).items():
+        monkeypatch.setenv(key, value)
+
+    saved = []
+    assert CheckpointClient(lambda: saved.append(True)).connect()
+    assert _wait_for(lambda: 'bot' in server._clients)
+
+    assert server.checkpoint(timeout=2) == {'bot'}
+    assert saved == [True]
+    server.close()
+
+
+def test_invalid_token_is_rejected():
+    server = CheckpointServer()
+    host, port = server.address.rsplit(':', 1)
+    with socket.create_connection((host, int(port))) as conn:
+        conn.sendall(b'HELLO wrong-token bot\n')
+        assert conn.recv(1) == b''  # Closed by the server
+    assert server.checkpoint(timeout=0.1) == set()
+    server.close()
+
+
+def test_project_resumes_from_checkpoint(tmp_path, monkeypatch):
+    src_dir = os.path.dirname(os.path.dirname(fortscript.__file__))
+    monkeypatch.setenv('PYTHONPATH', src_dir)
+    script = tmp_path / 'bot.py'
+    script.write_text(PROJECT)
+    events = tmp_path / 'events.txt'
+
+    app = FortScript(
+        config_path='nonexistent.yaml',
+        projects=[{'name': 'Bot', 'path': str(script)}],
+        checkpoint=True,
+    )
+    try:
+        app.start_scripts()
+        assert _wait_for(lambda: 'Bot' in app.checkpoints._clients)
+        app.stop_scripts()
+        assert app._checkpointed == {'Bot'}
+
+        app.start_scripts()
+        assert _wait_for(lambda: 'Bot' in app.checkpoints._clients)
+        app.stop_scripts(checkpoint=False)
+    finally:
+        app.checkpoints.close()
+
+    assert events.read_text().splitlines() == [
+        'start resumed=False',
+        'checkpoint',
+        'start resumed=True',
+    ]
+
+
+def test_module_imports_without_fortscript_dependencies():
+    """Projects can use the module without psutil or yaml installed."""
+    src_dir = os.path.dirname(os.path.dirname(fortscript.__file__))
+    code = (
+        'import sys\n'
+        'sys.modules.update(psutil=None, yaml=None)\n'
+        'from fortscript import checkpoint\n'
+        'print(checkpoint.resumed())\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        env={**os.environ, 'PYTHONPATH': src_dir},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.stdout.strip() == 'False', result.stderr
+
+
+def test_stray_connection_does_not_block_registration(monkeypatch):
+    server = CheckpointServer()
+    host, port = server.address.rsplit(':', 1)
+    with socket.create_connection((host, int(port))):
+        # The stray connection never says HELLO
+        for key, value in server.env('bot', resumed=False).items():
+            monkeypatch.setenv(key, value)
+        assert CheckpointClient(lambda: None).connect()
+        assert _wait_for(lambda: 'bot' in server._clients, timeout=1)
+    server.close()
+
+
+def test_close_releases_the_server():
+    app = FortScript(config_path='nonexistent.yaml', checkpoint=True)
+    server = app.checkpoints
+    app.close()
+    assert app.checkpoints is None
+    assert server._socket.fileno() == -1
+
+
+def test_pending_projects_keep_their_checkpoint(monkeypatch):
+    app = FortScript(config_path='nonexistent.yaml', checkpoint=True)
+    # 'late' checkpointed at the previous pause and is still waiting for
+    # admission, 'done' already started cold since then
+    app._checkpointed = {'late', 'done'}
+    app.admission.pending = [{'name': 'late'}]
+    monkeypatch.setattr(app.checkpoints, 'checkpoint', lambda timeout: {'a'})
+
+    app.stop_scripts()
+    assert app._checkpointed == {'a', 'late'}
+
+    app.stop_scripts(checkpoint=False)
+    assert app._checkpointed == set()
+    app.close()
@@ -0,0 +1,94 @@
+"""Tests for the resource-based heavy process detector."""
+
+import pytest
+
+from fortscript import AutoDetectConfig, FortScript
+from fortscript.detector import ResourceDetector
+from fortscript.procscan import ProcessSample
+
+MB = 1024 * 1024
+
+
+def _proc(pid, name, cpu=0.0, rss_mb=10):
+    return ProcessSample(pid, name, cpu, rss_mb * MB)
+
+
+def _detector(**limits):
+    return ResourceDetector(AutoDetectConfig(**limits))
+
+
+def test_flags_after_sustained_load_and_releases():
+    detector = _detector(cpu_percent=50, rss_mb=1000, sustain=3)
+    table = [_proc(10, 'idle'), _proc(20, 'newgame', cpu=90)]
+
+    assert detector.update(table) == {}
+    assert detector.update(table) == {}
+    assert detector.update(table) == {20: 'newgame'}
+
+    # A short dip doesn't release the process
+    table[1] = _proc(20, 'newgame', cpu=5)
+    assert detector.update(table) == {20: 'newgame'}
+    table[1] = _proc(20, 'newgame', cpu=90)
+    assert detector.update(table) == {20: 'newgame'}
+
+    table[1] = _proc(20, 'newgame', cpu=5)
+    for _ in range(3):
+        detector.update(table)
+    assert detector.hits == {}
+
+
+def test_memory_limit_and_exit():
+    detector = _detector(rss_mb=1000, sustain=1)
+    table = [_proc(30, 'electron', rss_mb=2000)]
+    assert detector.update(table) == {30: 'electron'}
+
+    table.clear()
+    assert detector.update(table) == {}
+
+
+def test_keeps_only_top_k():
+    detector = _detector(cpu_percent=10, sustain=1, top_k=3)
+    table = [_proc(pid, f'worker{pid}', cpu=pid) for pid in range(11, 30)]
+
+    detector.update(table)
+    assert [c.pid for c in detector.top] == [29, 28, 27]
+    assert set(detector.hits) == {27, 28, 29}
+
+
+def test_ignore_and_exclude():
+    detector = ResourceDetector(
+        AutoDetectConfig(cpu_percent=10, sustain=1, ignore=['FFmpeg']),
+        exclude={41}.__contains__,
+    )
+    table = [
+        _proc(40, 'ffmpeg', cpu=100),
+        _proc(41, 'project', cpu=100),
+        _proc(42, 'cc1plus', cpu=100),
+    ]
+    assert detector.update(table) == {42: 'cc1plus'}
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError, match='positive'):
+        _detector(cpu_percent=0)
+    with pytest.raises(ValueError, match='top_k'):
+        _detector(top_k=0)
+
+
+def test_hits_count_as_heavy(monkeypatch):
+    app = FortScript(
+        config_path='nonexistent.yaml',
+        heavy_process=[{'name': 'CS2', 'process': 'cs2'}],
+        auto_detect=AutoDetectConfig(cpu_percent=50, sustain=1),
+    )
+    table = [_proc(50, 'unknowngame', cpu=95), _proc(51, 'cs2')]
+    monkeypatch.setattr('fortscript.main.process_table', lambda _: table)
+
+    signals = app.apps_monitoring.sample()
+    assert signals == {'heavy': True, 'auto_heavy': True}
+    assert 'unknowngame (PID 50)' in app._pause_reason(signals)
+
+
+def test_detector_disabled_by_default():
+    app = FortScript(config_path='nonexistent.yaml')
+    assert app.apps_monitoring.detector is None
@@ -0,0 +1,82 @@
+"""Tests for the /proc process scanner."""
+
+import pytest
+
+from fortscript.main import AppsMonitoring
+from fortscript.procscan import ProcScanner, proc_scan_supported
+
+
+@pytest.fixture
+def fake_proc(tmp_path):
+    def add(pid, comm, cmdline=b''):
+        (tmp_path / pid).mkdir()
+        (tmp_path / pid / 'comm').write_bytes(comm + b'\n')
+        (tmp_path / pid / 'cmdline').write_bytes(cmdline)
+
+    add('1', b'systemd')
+    add('42', b'FortniteClient-', b'/games/FortniteClient-Win64.exe\0-a')
+    add('43', b'averyverylongna', b'/usr/bin/something-else\0')
+    (tmp_path / '99').mkdir()  # vanished before comm could be read
+    (tmp_path / 'self').mkdir()
+    return tmp_path
+
+
+@pytest.mark.skipif(not proc_scan_supported(), reason='Linux only')
+def test_names_are_read_from_comm(fake_proc):
+    names = ProcScanner(root=str(fake_proc)).names()
+    assert sorted(names) == [
+        'FortniteClient-Win64.exe',
+        'averyverylongna',
+        'systemd',
+    ]
+
+
+@pytest.mark.skipif(not proc_scan_supported(), reason='Linux only')
+def test_cmdline_completion_can_be_disabled(fake_proc):
+    names = ProcScanner(root=str(fake_proc), cmdline=False).names()
+    assert 'FortniteClient-' in names
+
+
+@pytest.mark.skipif(not proc_scan_supported(), reason='Linux only')
+def test_proc_backend_matches_psutil():
+    heavy = [{'name': 'Python', 'process': 'python'}]
+    psutil_status = AppsMonitoring(heavy, backend='psutil')
+    proc_status = AppsMonitoring(heavy, backend='proc')
+    assert proc_status.backend == 'proc'
+    assert (
+        proc_status.active_process_list()
+        == psutil_status.active_process_list()
+        == {'Python': True}
+    )
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match='backend'):
+        AppsMonitoring([], backend='wmi')
+
+
+@pytest.mark.skipif(not proc_scan_supported(), reason='Linux only')
+def test_processes_read_usage_from_stat(tmp_path, monkeypatch):
+    (tmp_path / '7').mkdir()
+    (tmp_path / '7' / 'cmdline').write_bytes(b'')
+    stat = tmp_path / '7' / 'stat'
+
+    def write_stat(utime):
+        # Names may contain spaces and parentheses
+        fields = ['S', *['0'] * 10, str(utime), '0', *['0'] * 8, '25']
+        stat.write_bytes(f'7 (a (b) c) {" ".join(fields)}\n'.encode())
+
+    scanner = ProcScanner(root=str(tmp_path))
+    clock = iter([100.0, 102.0])
+    monkeypatch.setattr('fortscript.procscan.time.monotonic', clock.__next__)
+
+    write_stat(utime=0)
+    (first,) = scanner.processes()
+    assert first.name == 'a (b) c'
+    assert first.cpu == 0
+    assert first.rss == 25 * scanner._page_size
+
+    # One second of CPU time over two seconds is half a core
+    write_stat(utime=scanner._clock_ticks)
+    (second,) = scanner.processes()
+    assert second.cpu == pytest.approx(50)
@@ -0,0 +1,99 @@
+"""Tests for the page-out pause mode."""
+
+import os
+import sys
+import time
+
+import psutil
+import pytest
+
+from fortscript import FortScript
+from fortscript.reclaim import anonymous_ranges, pageout_supported
+
+requires_pageout = pytest.mark.skipif(
+    not pageout_supported(), reason='Requires Linux 5.10+'
+)
+
+# Starts a worker process, so the project tree has two members
+SPAWNER = """
+import subprocess, sys, time
+subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])
+time.sleep(60)
+"""
+
+
+@requires_pageout
+def test_anonymous_ranges_skip_file_mappings():
+    ranges = anonymous_ranges(os.getpid())
+    assert ranges
+    assert all(length > 0 for _, length in ranges)
+
+    # The interpreter binary itself is file backed
+    with open(f'/proc/{os.getpid()}/maps') as maps:
+        exe_starts = {
+            int(line.split('-')[0], 16)
+            for line in maps
+            if line.rstrip().endswith(os.path.realpath(sys.executable))
+        }
+    assert not exe_starts & {start for start, _ in ranges}
+
+
+@requires_pageout
+def test_pageout_mode_suspends_and_resumes(tmp_path):
+    script = tmp_path / 'bot.py'
+    script.write_text('import time\ndata = bytearray(8 << 20)\ntime.sleep(60)')
+    app = FortScript(
+        config_path='nonexistent.yaml',
+        projects=[{'name': 'Bot', 'path': str(script)}],
+        pause_mode='pageout',
+    )
+    app.start_scripts()
+    try:
+        proc = psutil.Process(app.active_processes[0].pid)
+        time.sleep(0.5)
+
+        reclaimed = app.suspend_scripts()
+        assert set(reclaimed) == {'Bot'}
+        assert proc.status() == psutil.STATUS_STOPPED
+        assert app.suspended
+
+        app.resume_suspended()
+        assert proc.status() != psutil.STATUS_STOPPED
+        assert not app.suspended
+    finally:
+        app.stop_scripts(checkpoint=False)
+    assert not proc.is_running()
+
+
+def test_unknown_pause_mode_is_rejected():
+    with pytest.raises(ValueError, match='pause mode'):
+        FortScript(config_path='nonexistent.yaml', pause_mode='hibernate')
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='POSIX only')
+def test_pageout_error_does_not_skip_other_members(tmp_path, monkeypatch):
+    attempts = []
+
+    def failing_page_out(pid):
+        attempts.append(pid)
+        raise OSError('Operation not permitted')
+
+    monkeypatch.setattr('fortscript.main.page_out', failing_page_out)
+    script = tmp_path / 'bot.py'
+    script.write_text(SPAWNER)
+    app = FortScript(
+        config_path='nonexistent.yaml',
+        projects=[{'name': 'Bot', 'path': str(script)}],
+    )
+    app.start_scripts()
+    try:
+        tree = app._tree(app.active_processes[0])
+        deadline = time.monotonic() + 5
+        while len(tree.pids()) <= 1:
+            assert time.monotonic() < deadline, 'worker did not start'
+            time.sleep(0.05)
+
+        app.suspend_scripts()
+        assert set(attempts) == set(tree.pids())
+    finally:
+        app.stop_scripts(checkpoint=False)
@@ -0,0 +1,100 @@
+"""Tests for the timeline recorder."""
+
+import io
+import json
+import time
+
+import pytest
+
+from fortscript.cli import timeline
+from fortscript.recorder import (
+    TimelineRecord,
+    TimelineRecorder,
+    export_csv,
+    export_json,
+    read_timeline,
+)
+from fortscript.rules import Decision
+
+
+def _check(ram, heavy, decision, running=False):
+    return TimelineRecord(time.time(), ram, heavy, decision, running, 1, 2)
+
+
+def test_records_round_trip(tmp_path):
+    path = str(tmp_path / 'timeline.bin')
+    recorder = TimelineRecorder(path, capacity=10)
+    recorder.record(_check(72.5, False, Decision.RESUME, running=True))
+    recorder.record(_check(None, None, Decision.HOLD, running=True))
+    recorder.close()
+
+    first, second = read_timeline(path)
+    assert first.ram == pytest.approx(72.5)
+    assert first.heavy is False
+    assert first.decision == Decision.RESUME
+    assert first.running is True
+    assert second.ram is None
+    assert second.heavy is None
+
+
+def test_ring_keeps_latest_records_and_appends(tmp_path):
+    path = str(tmp_path / 'timeline.bin')
+    recorder = TimelineRecorder(path, capacity=3)
+    for ram in range(5):
+        recorder.record(_check(ram, False, Decision.HOLD))
+    recorder.close()
+
+    # Reopening with the same capacity keeps appending
+    recorder = TimelineRecorder(path, capacity=3)
+    recorder.record(_check(5, True, Decision.PAUSE))
+    recorder.close()
+
+    assert [r.ram for r in read_timeline(path)] == [3, 4, 5]
+
+
+def test_export_formats(tmp_path):
+    path = str(tmp_path / 'timeline.bin')
+    recorder = TimelineRecorder(path, capacity=2)
+    recorder.record(_check(50, True, Decision.PAUSE))
+    recorder.close()
+    records = read_timeline(path)
+
+    out = io.StringIO()
+    export_json(records, out)
+    assert json.loads(out.getvalue())[0]['decision'] == 'pause'
+
+    out = io.StringIO()
+    export_csv(records, out)
+    assert out.getvalue().splitlines()[0].startswith('timestamp,ram,heavy')
+
+
+def test_invalid_file_is_rejected(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'not a timeline')
+    with pytest.raises(ValueError, match='timeline'):
+        read_timeline(str(path))
+
+
+def test_truncated_file(tmp_path):
+    path = tmp_path / 'timeline.bin'
+    recorder = TimelineRecorder(str(path), capacity=4)
+    recorder.record(_check(50, True, Decision.PAUSE))
+    recorder.close()
+    path.write_bytes(path.read_bytes()[:40])
+
+    with pytest.raises(ValueError, match='truncated'):
+        read_timeline(str(path))
+
+    # The recorder starts a new ring instead of failing to map the file
+    recorder = TimelineRecorder(str(path), capacity=4)
+    recorder.record(_check(60, False, Decision.HOLD))
+    recorder.close()
+    assert [r.ram for r in read_timeline(str(path))] == [60]
+
+
+def test_cli_reports_invalid_file(tmp_path, capsys):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'FSTL')
+    with pytest.raises(SystemExit):
+        timeline.main([str(path)])
+    assert 'fort-timeline' in capsys.readouterr().err
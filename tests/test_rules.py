@@ -0,0 +1,112 @@
+"""Tests for the rule engine and monitor plugins."""
+
+from collections import namedtuple
+
+import pytest
+
+from fortscript import FortScript, Monitor, RuleConfig
+from fortscript.monitors import CpuMonitoring
+from fortscript.rules import Decision, RuleEngine
+
+CpuTimes = namedtuple('CpuTimes', 'user idle')
+
+
+class FakeMonitor(Monitor):
+    def __init__(self, signals):
+        self.values = signals
+        self.signals = tuple(signals)
+        self.calls = 0
+
+    def sample(self):
+        self.calls += 1
+        return dict(self.values)
+
+
+def test_default_rules_match_hysteresis():
+    """Default rules pause above `safe` and resume below it."""
+    engine = RuleEngine(
+        pause=RuleConfig.pause,
+        resume=RuleConfig.resume,
+        monitors=[FakeMonitor({'heavy': False, 'ram': 0.0})],
+        constants={'threshold': 95, 'safe': 85},
+    )
+    signals = {'heavy': False, 'ram': 90.0, 'safe': 85}
+    assert engine.decide(signals, running=True) == Decision.PAUSE
+    assert engine.decide(signals, running=False) == Decision.HOLD
+
+    signals = {'heavy': False, 'ram': 50.0, 'safe': 85}
+    assert engine.decide(signals, running=False) == Decision.RESUME
+    assert engine.decide({**signals, 'heavy': True}, False) == Decision.HOLD
+
+
+def test_signals_come_from_their_first_provider():
+    """A later monitor sampled for another signal keeps shared names."""
+    plugin = FakeMonitor({'ram': 10.0})
+    builtin = FakeMonitor({'ram': 99.0, 'mem_available': 4.0})
+    engine = RuleEngine(
+        'ram > 90 or mem_available < 1',
+        'ram < 50',
+        monitors=[plugin, builtin],
+    )
+
+    assert engine.sample() == {'ram': 10.0, 'mem_available': 4.0}
+    assert engine.signals == {'ram', 'mem_available'}
+
+
+def test_only_required_monitors_are_sampled():
+    """Monitors whose signals are not referenced are never sampled."""
+    cpu = FakeMonitor({'cpu': 95.0})
+    io = FakeMonitor({'disk_busy': 10.0})
+    engine = RuleEngine('cpu > 90', 'cpu < 50', monitors=[cpu, io])
+
+    signals = engine.sample()
+    assert engine.decide(signals, running=True) == Decision.PAUSE
+    assert cpu.calls == 1
+    assert io.calls == 0
+
+
+@pytest.mark.parametrize(
+    'expression',
+    ['__import__("os")', 'ram.real > 1', 'ram >', '"a" == ram'],
+)
+def test_invalid_rules_are_rejected(expression):
+    with pytest.raises(ValueError, match='rule'):
+        RuleEngine(expression, 'ram < 1', monitors=[FakeMonitor({'ram': 1})])
+
+
+def test_unknown_signal_is_rejected():
+    with pytest.raises(ValueError, match='unknown_signal'):
+        RuleEngine('unknown_signal > 1', 'ram < 1', monitors=[])
+
+
+def test_fortscript_custom_monitor_in_rules():
+    """Plugin monitors passed to FortScript can drive the rules."""
+    monitor = FakeMonitor({'game_mode': 1})
+    app = FortScript(
+        config_path='nonexistent.yaml',
+        rules=RuleConfig(pause='game_mode', resume='not game_mode'),
+        monitors=[monitor],
+    )
+    assert app.rule_engine.monitors == [monitor]
+    app.script_running = True
+    app.active_processes = []
+    assert app.tick() == Decision.PAUSE
+    assert app.script_running is False
+
+
+def test_monitor_requires_sample():
+    class Incomplete(Monitor):
+        signals = ('nothing',)
+
+    with pytest.raises(TypeError, match='sample'):
+        Incomplete()
+
+
+def test_cpu_monitors_keep_their_own_baseline(monkeypatch):
+    times = [CpuTimes(user=0.0, idle=0.0)]
+    monkeypatch.setattr('psutil.cpu_times', lambda: times[-1])
+    monitors = [CpuMonitoring() for _ in range(3)]
+
+    # Three quarters of the CPU time since the monitors were created
+    times.append(CpuTimes(user=30.0, idle=10.0))
+    assert [m.sample() for m in monitors] == [{'cpu': 75.0}] * 3
@@ -0,0 +1,206 @@
+"""Tests for the shared system sampler."""
+
+import time
+from collections import namedtuple
+
+import pytest
+
+from fortscript import (
+    AdmissionConfig,
+    AutoDetectConfig,
+    FortScript,
+    RuleConfig,
+    SystemSampler,
+)
+from fortscript import sampler as sampler_module
+from fortscript.monitors import CpuMonitoring
+from fortscript.procscan import ProcessSample
+from fortscript.rules import Decision
+
+Memory = namedtuple('Memory', 'percent available')
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'condition not reached'
+        time.sleep(0.01)
+
+
+def test_groups_share_one_scan_per_tick(monkeypatch):
+    calls = {'scan': 0, 'memory': 0}
+
+    def fake_names(scanner):
+        calls['scan'] += 1
+        return ['bash', 'cs2', 'cs2']
+
+    def fake_memory():
+        calls['memory'] += 1
+        return Memory(50.0, 8 * 1024**3)
+
+    monkeypatch.setattr(sampler_module, 'process_names', fake_names)
+    monkeypatch.setattr(sampler_module.psutil, 'virtual_memory', fake_memory)
+
+    shared = SystemSampler()
+    gaming = FortScript(
+        config_path='nonexistent.yaml',
+        heavy_process=[{'name': 'CS2', 'process': 'cs2'}],
+        sampler=shared,
+    )
+    render = FortScript(
+        config_path='nonexistent.yaml',
+        heavy_process=[{'name': 'Premiere', 'process': 'premiere'}],
+        sampler=shared,
+    )
+    ram_only = FortScript(
+        config_path='nonexistent.yaml',
+        rules=RuleConfig(pause='ram > safe', resume='ram < safe'),
+        sampler=shared,
+    )
+    assert shared.groups == [gaming, render, ram_only]
+
+    for group in shared.groups:
+        group.admission_config.enabled = False
+        group.start_scripts = lambda: None
+
+    assert shared.tick() == [Decision.HOLD, Decision.RESUME, Decision.RESUME]
+    assert gaming.apps_monitoring.last_status == {'CS2': True}
+    assert calls == {'scan': 1, 'memory': 1}
+
+    shared.tick()
+    assert calls == {'scan': 2, 'memory': 2}
+
+
+def _counting(monkeypatch):
+    calls = {'names': 0, 'table': 0, 'memory': 0}
+
+    def fake_names(scanner):
+        calls['names'] += 1
+        return ['cs2']
+
+    def fake_table(scanner):
+        calls['table'] += 1
+        return [ProcessSample(50, 'unknowngame', 95.0, 0)]
+
+    def fake_memory():
+        calls['memory'] += 1
+        return Memory(50.0, 8 * 1024**3)
+
+    monkeypatch.setattr(sampler_module, 'process_names', fake_names)
+    monkeypatch.setattr(sampler_module, 'process_table', fake_table)
+    monkeypatch.setattr(sampler_module.psutil, 'virtual_memory', fake_memory)
+    return calls
+
+
+def _group(shared, **options):
+    group = FortScript(
+        config_path='nonexistent.yaml',
+        heavy_process=[{'name': 'CS2', 'process': 'cs2'}],
+        sampler=shared,
+        admission=AdmissionConfig(enabled=False),
+        **options,
+    )
+    group.start_scripts = lambda: None
+    return group
+
+
+def test_detector_reuses_the_shared_process_table(monkeypatch):
+    calls = _counting(monkeypatch)
+    shared = SystemSampler()
+    for _ in range(3):
+        _group(shared, auto_detect=AutoDetectConfig(cpu_percent=50, sustain=1))
+
+    assert shared.tick() == [Decision.HOLD] * 3
+    assert calls['names'] == 0
+    assert calls['table'] == 1
+    for group in shared.groups:
+        assert group.apps_monitoring.detector.hits == {50: 'unknowngame'}
+
+
+def test_groups_checked_on_their_own_sample_fresh(monkeypatch):
+    calls = _counting(monkeypatch)
+    shared = SystemSampler()
+    group = _group(shared)
+
+    shared.tick()
+    assert calls['names'] == 1
+
+    group.tick()
+    group.tick()
+    assert calls == {'names': 3, 'table': 0, 'memory': 3}
+
+
+def test_start_poke_and_stop(monkeypatch):
+    calls = _counting(monkeypatch)
+    shared = SystemSampler(interval=60)
+    group = _group(shared)
+    stopped = []
+    group.stop = lambda: stopped.append(group)
+
+    shared.start()
+    _wait_for(lambda: calls['names'] == 1)
+    shared.poke()
+    _wait_for(lambda: calls['names'] > 1)
+
+    stopping = time.monotonic()
+    shared.stop()
+    assert time.monotonic() - stopping < 1
+    assert stopped == [group]
+    assert shared._thread is None
+
+
+def test_interrupted_run_stops_the_groups(monkeypatch):
+    _counting(monkeypatch)
+    shared = SystemSampler()
+    group = _group(shared)
+    stopped = []
+    group.stop = lambda: stopped.append(group)
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    group.tick = interrupted
+    with pytest.raises(KeyboardInterrupt):
+        shared.run()
+    assert stopped == [group]
+
+    # It can run again
+    del group.tick
+    shared.start()
+    shared.stop()
+
+
+def test_detectors_ignore_projects_of_every_group(monkeypatch):
+    calls = _counting(monkeypatch)
+    shared = SystemSampler()
+    limits = AutoDetectConfig(cpu_percent=50, sustain=1)
+    bots = _group(shared, auto_detect=limits)
+    render = _group(shared, auto_detect=limits)
+    # PID 50 is a busy project of the render group
+    render.is_project_process = {50}.__contains__
+
+    shared.tick()
+    assert calls['table'] == 1
+    assert bots.apps_monitoring.detector.hits == {}
+    assert render.apps_monitoring.detector.hits == {}
+
+
+def test_system_monitors_are_shared(monkeypatch):
+    _counting(monkeypatch)
+    samples = []
+
+    def fake_cpu(self):
+        samples.append(self)
+        return {'cpu': 95.0}
+
+    monkeypatch.setattr(CpuMonitoring, 'sample', fake_cpu)
+    shared = SystemSampler()
+    groups = [
+        _group(shared, rules=RuleConfig(pause='cpu > 90', resume='cpu < 50'))
+        for _ in range(3)
+    ]
+    for group in groups:
+        group.script_running = True
+
+    assert shared.tick() == [Decision.PAUSE] * 3
+    assert len(samples) == 1
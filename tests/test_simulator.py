@@ -0,0 +1,99 @@
+"""Tests for the offline policy simulator."""
+
+from fortscript import AdmissionConfig, RamConfig, RuleConfig
+from fortscript.recorder import TimelineRecord
+from fortscript.rules import Decision
+from fortscript.simulator import (
+    ProjectModel,
+    TraceProfile,
+    TraceSample,
+    from_timeline,
+    simulate,
+    sweep,
+    synthetic_trace,
+)
+
+RAM = RamConfig(threshold=95, safe=85)
+NO_ADMISSION = AdmissionConfig(enabled=False)
+
+
+def _trace(values):
+    return [
+        TraceSample(i * 5.0, ram, heavy)
+        for i, (ram, heavy) in enumerate(values)
+    ]
+
+
+def test_pause_and_resume_counts():
+    trace = _trace([
+        (50, False),  # resume
+        (50, True),  # pause (heavy)
+        (50, True),
+        (50, False),  # resume
+        (90, False),  # pause (RAM)
+        (90, False),
+    ])
+    result = simulate(trace, RAM)
+    assert (result.resumes, result.pauses) == (2, 2)
+    assert result.paused_time == 3 * 5.0
+
+
+def test_project_ram_causes_flaps():
+    """Projects that push RAM over `safe` when started keep flapping."""
+    trace = _trace([(80, False)] * 10)
+    calm = simulate(trace, RAM)
+    flapping = simulate(
+        trace, RAM, projects=ProjectModel(ram=[10], admission=NO_ADMISSION)
+    )
+    assert calm.flaps == 0
+    assert flapping.flaps == flapping.pauses == len(trace) // 2
+
+
+def test_admission_staggers_resumes():
+    """Projects start one per check and stop before crossing `safe`."""
+    trace = _trace([(78, False)] * 10)
+    projects = [3.0, 3.0, 3.0]
+
+    at_once = simulate(
+        trace, RAM, projects=ProjectModel(projects, NO_ADMISSION)
+    )
+    staggered = simulate(trace, RAM, projects=ProjectModel(projects))
+    assert at_once.flaps > 0
+    assert (staggered.resumes, staggered.pauses) == (1, 0)
+
+
+def test_sweep_skips_invalid_combinations():
+    trace = synthetic_trace(TraceProfile(duration=600), seed=42)
+    results = sweep(trace, thresholds=[80, 90], safes=[70, 85])
+    assert {(r.threshold, r.safe) for r in results} == {
+        (80, 70),
+        (90, 70),
+        (90, 85),
+    }
+
+
+def test_from_timeline_removes_project_ram():
+    records = [
+        # RAM is sampled before the decision: stopped before a resume
+        TimelineRecord(0, 70.0, False, Decision.RESUME, True, 0, 0),
+        TimelineRecord(5, None, None, Decision.HOLD, True, 0, 0),
+        TimelineRecord(10, 75.0, False, Decision.HOLD, True, 0, 0),
+        # ...and running before a pause
+        TimelineRecord(15, 90.0, True, Decision.PAUSE, False, 0, 0),
+        TimelineRecord(20, 72.0, True, Decision.HOLD, False, 0, 0),
+    ]
+    trace = from_timeline(records, project_ram=10)
+    assert [s.ram for s in trace] == [70.0, 65.0, 80.0, 72.0]
+    assert [s.heavy for s in trace] == [False, False, True, True]
+
+
+def test_default_rules_fast_path_matches_rule_engine():
+    trace = synthetic_trace(TraceProfile(duration=3600), seed=3)
+    # Same rules, but not equal to the defaults, so they go through eval
+    spelled_out = RuleConfig(
+        pause='ram > safe or heavy', resume='ram < safe and not heavy'
+    )
+    options = {'projects': ProjectModel([5, 3])}
+    assert sweep(trace, [85, 95], [70, 80], **options) == sweep(
+        trace, [85, 95], [70, 80], rules=spelled_out, **options
+    )
@@ -0,0 +1,76 @@
+"""Tests for the project spawner."""
+
+import os
+import sys
+import time
+
+import pytest
+
+from fortscript.spawn import EXIT_UNKNOWN, Spawner
+
+CRASH_CODE = 7
+
+
+def _wait(proc, timeout=10):
+    deadline = time.monotonic() + timeout
+    while proc.poll() is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return proc.poll()
+
+
+def test_resolution_is_cached_until_invalidated(tmp_path, monkeypatch):
+    script = str(tmp_path / 'bot.py')
+    spawner = Spawner()
+
+    calls = []
+    real_exists = os.path.exists
+    monkeypatch.setattr(
+        os.path, 'exists', lambda p: calls.append(p) or real_exists(p)
+    )
+    spec = spawner.resolve('Bot', script)
+    assert spawner.resolve('Bot', script) is spec
+    assert len(calls) == 1
+    assert spec.argv == (sys.executable, script)
+
+    spawner.invalidate()
+    spawner.resolve('Bot', script)
+    assert calls == [calls[0]] * 2
+
+
+def test_unsupported_project_is_not_resolved():
+    assert Spawner().resolve('Notes', 'notes.txt') is None
+
+
+def test_spawn_runs_project_and_records_latency(tmp_path):
+    script = tmp_path / 'bot.py'
+    script.write_text(
+        'import os, sys\n'
+        "sys.exit(0 if os.environ['FORT_TEST'] == 'yes' else 3)\n"
+    )
+    spawner = Spawner()
+    spec = spawner.resolve('Bot', str(script))
+    proc = spawner.spawn(spec, extra_env={'FORT_TEST': 'yes'})
+
+    assert _wait(proc) == 0
+    assert spawner.latency['Bot'] > 0
+    assert 'FORT_TEST' not in spec.env
+
+
+@pytest.mark.skipif(not hasattr(os, 'posix_spawn'), reason='POSIX only')
+def test_posix_spawn_reports_exit_code(tmp_path):
+    script = tmp_path / 'crash.py'
+    script.write_text(f'raise SystemExit({CRASH_CODE})\n')
+    spawner = Spawner()
+    proc = spawner.spawn(spawner.resolve('Crash', str(script)))
+    assert type(proc).__name__ == 'SpawnedProcess'
+    assert _wait(proc) == CRASH_CODE
+
+
+@pytest.mark.skipif(not hasattr(os, 'posix_spawn'), reason='POSIX only')
+def test_status_of_child_reaped_elsewhere_is_unknown(tmp_path):
+    script = tmp_path / 'crash.py'
+    script.write_text(f'raise SystemExit({CRASH_CODE})\n')
+    spawner = Spawner()
+    proc = spawner.spawn(spawner.resolve('Crash', str(script)))
+    os.waitpid(proc.pid, 0)
+    assert proc.poll() == EXIT_UNKNOWN
@@ -0,0 +1,150 @@
+"""Tests for the background supervisor API."""
+
+import threading
+import time
+
+import psutil
+import pytest
+
+from fortscript import AdmissionConfig, FortScript, RuleConfig, TimelineConfig
+from fortscript.recorder import read_timeline
+from fortscript.rules import Decision
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'condition not reached'
+        time.sleep(0.01)
+
+
+def _counting(app):
+    checks = []
+    tick = app.tick
+
+    def counted():
+        decision = tick()
+        checks.append(time.monotonic())
+        return decision
+
+    app.tick = counted
+    return checks
+
+
+def test_poke_and_stop_skip_the_interval():
+    app = FortScript(config_path='nonexistent.yaml')
+    checks = _counting(app)
+
+    app.start()
+    _wait_for(lambda: checks)
+    assert app.state().supervising
+
+    poked = time.monotonic()
+    app.poke()
+    _wait_for(lambda: len(checks) > 1, timeout=1)
+    assert checks[1] - poked < 1
+
+    stopping = time.monotonic()
+    app.stop()
+    assert time.monotonic() - stopping < 1
+    assert not app.state().supervising
+
+
+def test_stop_terminates_projects(tmp_path):
+    script = tmp_path / 'bot.py'
+    script.write_text('import time\ntime.sleep(60)')
+    app = FortScript(
+        config_path='nonexistent.yaml',
+        projects=[{'name': 'Bot', 'path': str(script)}],
+        rules=RuleConfig(pause='False', resume='True'),
+        admission=AdmissionConfig(enabled=False),
+    )
+
+    app.start()
+    _wait_for(lambda: app.state().projects == ('Bot',))
+    state = app.state()
+    assert state.script_running
+    assert state.decision == Decision.RESUME
+    assert state.checked_at is not None
+    proc = psutil.Process(app.active_processes[0].pid)
+
+    app.stop()
+    assert not proc.is_running() or proc.status() == psutil.STATUS_ZOMBIE
+    assert app.state().projects == ()
+    assert not app.state().script_running
+
+
+def test_run_returns_when_stopped():
+    app = FortScript(config_path='nonexistent.yaml')
+    checks = _counting(app)
+    runner = threading.Thread(target=app.run)
+    runner.start()
+
+    _wait_for(lambda: checks)
+    assert app.state().supervising
+    app.stop()
+    runner.join(timeout=1)
+    assert not runner.is_alive()
+
+
+def test_interrupted_run_can_be_started_again():
+    app = FortScript(config_path='nonexistent.yaml')
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    app.tick = interrupted
+    with pytest.raises(KeyboardInterrupt):
+        app.run()
+    assert not app.state().supervising
+
+    del app.tick  # Back to the real check
+    checks = _counting(app)
+    app.start()
+    _wait_for(lambda: checks)
+    assert app.state().supervising
+    app.stop()
+
+
+def test_stop_does_not_wait_for_the_thread_that_called_run():
+    app = FortScript(config_path='nonexistent.yaml')
+    checks = _counting(app)
+    after_run = threading.Event()
+
+    def embedder():
+        app.run()
+        after_run.wait(5)  # The thread keeps working after run() returns
+
+    runner = threading.Thread(target=embedder)
+    runner.start()
+    _wait_for(lambda: checks)
+
+    stopping = time.monotonic()
+    app.stop()
+    assert time.monotonic() - stopping < 1
+    assert not app.state().supervising
+    after_run.set()
+    runner.join(timeout=1)
+
+
+def test_stop_closes_and_start_reopens_resources(tmp_path):
+    app = FortScript(
+        config_path='nonexistent.yaml',
+        checkpoint=True,
+        timeline=TimelineConfig(path=str(tmp_path / 'checks.bin')),
+    )
+    server = app.checkpoints
+    checks = _counting(app)
+    app.start()
+    _wait_for(lambda: checks)
+    app.stop()
+
+    assert app.checkpoints is None
+    assert app.recorder is None
+    assert server._socket.fileno() == -1
+
+    app.start()
+    assert app.checkpoints is not None
+    assert app.recorder is not None
+    app.stop()
+    assert len(read_timeline(str(tmp_path / 'checks.bin'))) >= len(checks)
@@ -0,0 +1,211 @@
+"""Tests for project process tree tracking."""
+
+import os
+import sys
+import time
+
+import psutil
+import pytest
+
+from fortscript import AdmissionConfig, FortScript, Monitor, RuleConfig
+from fortscript.rules import Decision
+from fortscript.spawn import LaunchSpec, Spawner
+from fortscript.tree import TreeTracker, delegated_cgroup
+
+pytestmark = pytest.mark.skipif(os.name == 'nt', reason='POSIX only')
+
+# Forks a grandchild that outlives its parent, so it is reparented to init.
+# With ``setsid``, the grandchild also leaves the project session.
+DAEMON = """
+import os, time
+if os.fork() == 0:
+    if os.fork() == 0:
+        if {setsid}:
+            os.setsid()
+        with open({pid_file!r}, 'w') as f:
+            f.write(str(os.getpid()))
+        time.sleep(60)
+    os._exit(0)
+time.sleep({lifetime})
+"""
+
+
+def _write_daemon(tmp_path, setsid=False, lifetime=60):
+    script = tmp_path / 'daemon.py'
+    pid_file = tmp_path / 'grandchild.pid'
+    script.write_text(
+        DAEMON.format(setsid=setsid, pid_file=str(pid_file), lifetime=lifetime)
+    )
+    return script, pid_file
+
+
+def _grandchild(pid_file):
+    deadline = time.monotonic() + 5
+    while not pid_file.exists() or not pid_file.read_text():
+        assert time.monotonic() < deadline, 'grandchild did not start'
+        time.sleep(0.05)
+    return psutil.Process(int(pid_file.read_text()))
+
+
+def _launch(tmp_path, tracker, setsid=False):
+    script, pid_file = _write_daemon(tmp_path, setsid)
+    spec = LaunchSpec(
+        'Daemon', (sys.executable, str(script)), None, dict(os.environ)
+    )
+    proc = Spawner().spawn(spec)
+    tree = tracker.track(proc, 'Daemon')
+    return proc, tree, _grandchild(pid_file)
+
+
+def _wait_gone(p, timeout=5):
+    try:
+        p.wait(timeout)
+    except psutil.TimeoutExpired:
+        pass
+    return not p.is_running() or p.status() == psutil.STATUS_ZOMBIE
+
+
+def test_session_mode_kills_reparented_grandchild(tmp_path):
+    proc, tree, grandchild = _launch(tmp_path, TreeTracker(use_cgroup=False))
+    assert tree.mode == 'session'
+    assert grandchild.ppid() != proc.pid
+    assert tree.contains(grandchild.pid)
+    assert not tree.contains(os.getpid())
+
+    tree.terminate()
+    assert _wait_gone(grandchild)
+    assert not tree.is_alive()
+
+
+def test_walk_mode_misses_reparented_grandchild(tmp_path):
+    proc, tree, grandchild = _launch(tmp_path, TreeTracker(use_cgroup=False))
+    tree.session = False
+    assert tree.mode == 'walk'
+    try:
+        assert grandchild.pid not in tree.pids()
+        tree.terminate()
+        assert not _wait_gone(grandchild, timeout=0.5)
+    finally:
+        grandchild.kill()
+
+
+@pytest.mark.skipif(
+    delegated_cgroup() is None, reason='Requires a delegated cgroup v2'
+)
+def test_cgroup_mode_kills_escaped_grandchild(tmp_path):
+    proc, tree, grandchild = _launch(tmp_path, TreeTracker(), setsid=True)
+    try:
+        assert tree.mode == 'cgroup'
+        # The grandchild left the session, only the cgroup still holds it
+        assert os.getsid(grandchild.pid) != proc.pid
+
+        tree.kill()
+        assert _wait_gone(grandchild)
+        assert not tree.pids()
+    finally:
+        if grandchild.is_running():
+            grandchild.kill()
+        tree.release()
+    assert not os.path.exists(tree.cgroup)
+
+
+@pytest.mark.skipif(
+    delegated_cgroup() is None, reason='Requires a delegated cgroup v2'
+)
+def test_cgroup_kill_reaches_session_members(tmp_path):
+    # The cgroup is empty, the tree is only reachable through its session
+    cgroup = os.path.join(delegated_cgroup(), f'fortscript-test-{os.getpid()}')
+    os.mkdir(cgroup)
+    proc, tree, grandchild = _launch(tmp_path, TreeTracker(use_cgroup=False))
+    tree.cgroup = cgroup
+    try:
+        tree.kill()
+        assert _wait_gone(grandchild)
+    finally:
+        if grandchild.is_running():
+            grandchild.kill()
+        tree.release()
+
+
+def test_stop_scripts_kills_whole_tree(tmp_path):
+    script, pid_file = _write_daemon(tmp_path)
+    app = FortScript(
+        config_path='nonexistent.yaml',
+        projects=[{'name': 'Daemon', 'path': str(script)}],
+    )
+    app.start_scripts()
+    grandchild = _grandchild(pid_file)
+
+    app.stop_scripts(checkpoint=False)
+    assert _wait_gone(grandchild)
+    assert not app.active_processes
+
+
+class Switch(Monitor):
+    """Provides a ``busy`` signal set by the test."""
+
+    signals = ('busy',)
+
+    def __init__(self):
+        self.busy = False
+
+    def sample(self):
+        return {'busy': self.busy}
+
+
+def _exited_project(tmp_path, **options):
+    """Starts a project whose leader exits and leaves a grandchild."""
+    script, pid_file = _write_daemon(tmp_path, lifetime=0)
+    app = FortScript(
+        config_path='nonexistent.yaml',
+        projects=[{'name': 'Daemon', 'path': str(script)}],
+        admission=AdmissionConfig(enabled=False),
+        **options,
+    )
+    app.tick()
+    grandchild = _grandchild(pid_file)
+    leader = app.active_processes[0]
+    deadline = time.monotonic() + 5
+    while leader.poll() is None:
+        assert time.monotonic() < deadline, 'project did not exit'
+        time.sleep(0.05)
+    return app, leader, grandchild
+
+
+def test_stop_scripts_kills_orphans_of_exited_project(tmp_path):
+    app, leader, grandchild = _exited_project(tmp_path)
+
+    # The leader is gone but its tree is kept while the grandchild runs
+    app._check_dead_processes(script_running=True)
+    assert not app.active_processes
+    assert leader.pid in app._trees
+
+    app.stop_scripts(checkpoint=False)
+    assert _wait_gone(grandchild)
+    assert not app._trees
+
+
+def test_stop_kills_orphans_of_exited_project(tmp_path):
+    app, _, grandchild = _exited_project(tmp_path)
+    app._check_dead_processes(script_running=True)
+
+    app.stop()
+    assert _wait_gone(grandchild)
+    assert not app._trees
+
+
+def test_pause_kills_orphans_of_exited_project(tmp_path):
+    switch = Switch()
+    app, _, grandchild = _exited_project(
+        tmp_path,
+        monitors=[switch],
+        rules=RuleConfig(pause='busy', resume='not busy'),
+    )
+    assert app.tick() == Decision.HOLD
+    assert not app.active_processes
+    assert app.script_running
+
+    switch.busy = True
+    assert app.tick() == Decision.PAUSE
+    assert _wait_gone(grandchild)
+    assert not app._trees